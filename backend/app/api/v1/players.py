@@ -7,7 +7,7 @@ logger = logging.getLogger(__name__)
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func, select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.database import get_db
 from app.models import Player, PlayerRanking, PlayerProjection, PlayerNews, DraftSession, PositionTier, Team, League
@@ -316,13 +316,15 @@ async def get_player(
 ):
     """Get detailed player information including rankings, projections, and news."""
     from app.models import PlayerProjection, PlayerRanking, ProspectProfile
+    # Collections load with one IN query each; the many-to-one sources and the
+    # one-to-one prospect profile ride along as JOINs instead of extra SELECTs.
     query = (
         select(Player)
         .options(
-            selectinload(Player.rankings).selectinload(PlayerRanking.source),
-            selectinload(Player.projections).selectinload(PlayerProjection.source),
+            selectinload(Player.rankings).joinedload(PlayerRanking.source),
+            selectinload(Player.projections).joinedload(PlayerProjection.source),
             selectinload(Player.news_items),
-            selectinload(Player.prospect_profile),
+            joinedload(Player.prospect_profile),
             selectinload(Player.position_tiers),
         )
         .where(Player.id == player_id)
@@ -647,53 +649,59 @@ async def predict_player_availability(
         rank_std_dev=player.rank_std_dev
     )
 
-    # Get all available players with their ADP data
-    all_players_query = (
-        select(Player)
-        .options(selectinload(Player.rankings).selectinload(PlayerRanking.source))
-    )
-    all_result = await db.execute(all_players_query)
-    all_players = all_result.scalars().all()
-
-    # Build list of (player_id, adp, volatility) for all available players
-    all_players_adp = []
-    already_drafted_ids = set()
-
-    for p in all_players:
-        if p.is_drafted:
-            already_drafted_ids.add(p.id)
-            continue
-
-        # Get this player's ADP and volatility
-        p_adp = None
-        p_best = None
-        p_worst = None
-
-        for r in p.rankings:
-            if r.source and "ECR" in r.source.name:
-                if r.best_rank and r.worst_rank:
-                    p_best = r.best_rank
-                    p_worst = r.worst_rank
-                if r.avg_rank:
-                    p_adp = r.avg_rank
-                elif r.overall_rank:
-                    p_adp = float(r.overall_rank)
-
-            if p_adp is None and r.adp:
-                p_adp = r.adp
-
-        # Use consensus rank as fallback
-        if p_adp is None and p.consensus_rank:
-            p_adp = float(p.consensus_rank)
-
-        if p_adp is not None:
-            p_vol = get_player_volatility(
-                player_adp=p_adp,
-                best_rank=p_best,
-                worst_rank=p_worst,
-                rank_std_dev=p.rank_std_dev
-            )
-            all_players_adp.append((p.id, p_adp, p_vol))
+    # A drafted target's verdict doesn't depend on the rest of the pool, so
+    # skip loading every player's rankings
+    if player.is_drafted:
+        all_players_adp = []
+        already_drafted_ids = {player.id}
+    else:
+        # Get all available players with their ADP data
+        all_players_query = (
+            select(Player)
+            .options(selectinload(Player.rankings).selectinload(PlayerRanking.source))
+        )
+        all_result = await db.execute(all_players_query)
+        all_players = all_result.scalars().all()
+
+        # Build list of (player_id, adp, volatility) for all available players
+        all_players_adp = []
+        already_drafted_ids = set()
+
+        for p in all_players:
+            if p.is_drafted:
+                already_drafted_ids.add(p.id)
+                continue
+
+            # Get this player's ADP and volatility
+            p_adp = None
+            p_best = None
+            p_worst = None
+
+            for r in p.rankings:
+                if r.source and "ECR" in r.source.name:
+                    if r.best_rank and r.worst_rank:
+                        p_best = r.best_rank
+                        p_worst = r.worst_rank
+                    if r.avg_rank:
+                        p_adp = r.avg_rank
+                    elif r.overall_rank:
+                        p_adp = float(r.overall_rank)
+
+                if p_adp is None and r.adp:
+                    p_adp = r.adp
+
+            # Use consensus rank as fallback
+            if p_adp is None and p.consensus_rank:
+                p_adp = float(p.consensus_rank)
+
+            if p_adp is not None:
+                p_vol = get_player_volatility(
+                    player_adp=p_adp,
+                    best_rank=p_best,
+                    worst_rank=p_worst,
+                    rank_std_dev=p.rank_std_dev
+                )
+                all_players_adp.append((p.id, p_adp, p_vol))
 
     # Run the prediction
     predictor = PickPredictor(num_simulations=simulations)
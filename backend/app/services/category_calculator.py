@@ -1,5 +1,8 @@
 import statistics
-from typing import Dict, List, Optional, Any
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -35,6 +38,10 @@ class CategoryCalculator:
 
     # Categories where lower is better
     INVERTED_CATEGORIES = ["era", "whip"]
+
+    # Need priority bands: strength < 40 high, < 55 medium, < 70 low, 70+ no need
+    NEED_PRIORITY_EDGES = (40, 55, 70)
+    NEED_PRIORITY_LABELS = ("high", "medium", "low")
     CATEGORY_POSITION_HINTS = {
         "runs": "OF/SS/2B",
         "hr": "1B/OF/3B",
@@ -60,7 +67,49 @@ class CategoryCalculator:
         Based on projected stats of drafted players.
         """
         team_totals = await self._aggregate_team_projections(db, team_id)
+        return self._strengths_from_totals(team_totals)
+
+    async def get_team_needs(
+        self,
+        db: AsyncSession,
+        team_id: int,
+    ) -> List[Dict]:
+        """
+        Identify categories where team is weakest.
+        Returns sorted list of needs with priority.
+        """
+        strengths = await self.get_team_strengths(db, team_id)
+        return self._needs_from_strengths(strengths)
+
+    async def get_team_needs_bulk(
+        self,
+        db: AsyncSession,
+        team_ids: List[int],
+    ) -> Dict[int, List[Dict]]:
+        """
+        Identify category needs for several teams with a single picks query.
+        Returns {team_id: needs} in the same shape as get_team_needs.
+        """
+        picks_query = (
+            select(DraftPick)
+            .options(selectinload(DraftPick.player).selectinload(Player.projections))
+            .where(DraftPick.team_id.in_(team_ids))
+        )
+        result = await db.execute(picks_query)
+
+        picks_by_team: Dict[int, List[DraftPick]] = {team_id: [] for team_id in team_ids}
+        for pick in result.scalars().all():
+            picks_by_team[pick.team_id].append(pick)
 
+        return {
+            team_id: self._needs_from_strengths(
+                self._strengths_from_totals(self._aggregate_picks(picks))
+            )
+            for team_id, picks in picks_by_team.items()
+        }
+
+    def _strengths_from_totals(self, team_totals: Dict[str, float]) -> Dict[str, float]:
+        """Convert aggregated team totals into 0-100 category strengths."""
         strengths = {}
         for category, target in self.LEAGUE_TARGETS.items():
             projected = team_totals.get(category, 0)
@@ -82,37 +131,31 @@ class CategoryCalculator:
 
         return strengths
 
-    async def get_team_needs(
-        self,
-        db: AsyncSession,
-        team_id: int,
-    ) -> List[Dict]:
-        """
-        Identify categories where team is weakest.
-        Returns sorted list of needs with priority.
-        """
-        strengths = await self.get_team_strengths(db, team_id)
-
-        needs = []
+    def _needs_from_strengths(self, strengths: Dict[str, float]) -> List[Dict]:
+        """Build the weakest-first needs list from category strengths."""
+        weak = []
         for category, strength in strengths.items():
-            if strength < 70:  # Below 70% of target = need
-                priority = "high" if strength < 40 else "medium" if strength < 55 else "low"
-                target = self.LEAGUE_TARGETS[category]
+            band = bisect_right(self.NEED_PRIORITY_EDGES, strength)
+            if band < len(self.NEED_PRIORITY_LABELS):  # Below 70% of target = need
+                weak.append((round(strength, 1), category, strength, band))
 
-                if category in self.INVERTED_CATEGORIES:
-                    gap = 0  # Gap calculation is different for ratios
-                else:
-                    gap = target * (1 - strength / 100)
+        # Sort by strength (weakest first); stable, so ties keep category order
+        weak.sort(key=itemgetter(0))
 
-                needs.append({
-                    "category": category,
-                    "strength": round(strength, 1),
-                    "priority": priority,
-                    "gap": round(gap, 1),
-                })
+        needs = []
+        for rounded, category, strength, band in weak:
+            if category in self.INVERTED_CATEGORIES:
+                gap = 0  # Gap calculation is different for ratios
+            else:
+                gap = self.LEAGUE_TARGETS[category] * (1 - strength / 100)
+
+            needs.append({
+                "category": category,
+                "strength": rounded,
+                "priority": self.NEED_PRIORITY_LABELS[band],
+                "gap": round(gap, 1),
+            })
 
-        # Sort by strength (weakest first)
-        needs.sort(key=lambda x: x["strength"])
         return needs
 
     async def simulate_pick(
@@ -177,8 +220,13 @@ class CategoryCalculator:
             .where(DraftPick.team_id == team_id)
         )
         result = await db.execute(picks_query)
-        picks = result.scalars().all()
+        return self._aggregate_picks(result.scalars().all())
 
+    def _aggregate_picks(self, picks: List[DraftPick]) -> Dict[str, float]:
+        """
+        Sum up projected stats for a set of draft picks (with players and
+        projections already loaded).
+        """
         totals = {
             "runs": 0,
             "hr": 0,
@@ -325,21 +373,34 @@ class CategoryCalculator:
         Counting stats scale linearly from 12-team baseline.
         Ratio categories remain fixed unless explicitly overridden.
         """
+        overrides_key = frozenset((target_overrides or {}).items())
+        return dict(self._scaled_target_items(num_teams, overrides_key))
+
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _scaled_target_items(
+        cls,
+        num_teams: int,
+        overrides_key: FrozenSet[Tuple[str, float]],
+    ) -> Tuple[Tuple[str, float], ...]:
+        """
+        Cached core of get_scaled_targets. Draft-room polling asks for the
+        same league size over and over, so the scaled targets are computed
+        once per (num_teams, overrides) pair.
+        """
         scale = max(num_teams, 1) / 12.0
-        overrides = target_overrides or {}
-        targets: Dict[str, float] = {}
+        overrides = dict(overrides_key)
+        targets: List[Tuple[str, float]] = []
 
-        for category, base_target in self.LEAGUE_TARGETS.items():
+        for category, base_target in cls.LEAGUE_TARGETS.items():
             if category in overrides:
-                targets[category] = float(overrides[category])
-                continue
-
-            if category in self.INVERTED_CATEGORIES:
-                targets[category] = float(base_target)
+                targets.append((category, float(overrides[category])))
+            elif category in cls.INVERTED_CATEGORIES:
+                targets.append((category, float(base_target)))
             else:
-                targets[category] = float(base_target * scale)
+                targets.append((category, float(base_target * scale)))
 
-        return targets
+        return tuple(targets)
 
     async def get_team_totals(
         self,
@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Awaitable, Callable, Optional, List, Dict
 import statistics
 
 import pandas as pd
@@ -11,7 +12,12 @@ import feedparser
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.utils import find_player_by_name, normalize_name
+from app.utils import (
+    birth_date_from_epoch_ms,
+    calculate_age_from_birthdate,
+    find_player_by_name,
+    normalize_name,
+)
 from app.config import settings
 
 from app.models import (
@@ -50,9 +56,23 @@ class DataSyncService:
     # Rate limiting: minimum seconds between requests
     RATE_LIMIT_SECONDS = 1.0
 
-    def __init__(self):
+    def __init__(
+        self,
+        time_source: Callable[[], float] = time.monotonic,
+        sleeper: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rate: Optional[float] = None,
+        burst: int = 1,
+    ):
         self._http_client: Optional[httpx.AsyncClient] = None
-        self._last_request_time: float = 0
+
+        # Token bucket: `rate` requests/sec refill, up to `burst` banked tokens.
+        # Defaults keep the historical 1 req/sec with no bursting.
+        self._time_source = time_source
+        self._sleeper = sleeper
+        self._rate = rate if rate is not None else 1.0 / self.RATE_LIMIT_SECONDS
+        self._burst = burst
+        self._tokens: float = float(burst)
+        self._last_refill: float = time_source()
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._http_client is None:
@@ -69,23 +89,31 @@ class DataSyncService:
             self._http_client = None
             logger.info("DataSyncService HTTP client closed")
 
+    async def _acquire_rate_limit_token(self) -> None:
+        """
+        Take one token from the bucket, sleeping until it is available.
+
+        The token is reserved before sleeping (the balance may go negative),
+        so concurrent callers queue up behind each other without a lock.
+        """
+        now = self._time_source()
+        self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+        self._tokens -= 1
+        if self._tokens < 0:
+            await self._sleeper(-self._tokens / self._rate)
+
     async def _rate_limited_request(
         self,
         method: str,
         url: str,
         **kwargs
     ) -> httpx.Response:
-        """Make a rate-limited HTTP request (1 req/sec)."""
-        import time
-
-        # Enforce rate limiting
-        now = time.time()
-        time_since_last = now - self._last_request_time
-        if time_since_last < self.RATE_LIMIT_SECONDS:
-            await asyncio.sleep(self.RATE_LIMIT_SECONDS - time_since_last)
+        """Make a rate-limited HTTP request (1 req/sec by default)."""
+        await self._acquire_rate_limit_token()
 
         client = await self._get_client()
-        self._last_request_time = time.time()
 
         if method.upper() == "GET":
             return await client.get(url, **kwargs)
@@ -1304,19 +1332,8 @@ class DataSyncService:
                             positions.append(pos)
 
                     # Extract birth date from ESPN data (dateOfBirth is in milliseconds)
-                    birth_date = None
-                    age = None
-                    date_of_birth_ms = player_data.get("dateOfBirth")
-                    if date_of_birth_ms:
-                        try:
-                            birth_date = datetime.fromtimestamp(date_of_birth_ms / 1000)
-                            # Calculate current age
-                            today = datetime.now()
-                            age = today.year - birth_date.year
-                            if (today.month, today.day) < (birth_date.month, birth_date.day):
-                                age -= 1
-                        except (ValueError, OSError):
-                            pass
+                    birth_date = birth_date_from_epoch_ms(player_data.get("dateOfBirth"))
+                    age = calculate_age_from_birthdate(birth_date) if birth_date else None
 
                     # Check if player exists
                     player_query = select(Player).where(Player.espn_id == espn_id)
@@ -1331,9 +1348,7 @@ class DataSyncService:
                         # Update existing
                         player.espn_id = espn_id
                         if team:
-                            if player.team and player.team != team:
-                                player.previous_team = player.team
-                            player.team = team
+                            self._apply_team_change(player, team)
                         if positions:
                             player.positions = "/".join(positions)
                             player.primary_position = primary_position or positions[0]
@@ -1369,6 +1384,18 @@ class DataSyncService:
             logger.error(f"ESPN player universe fetch failed: {e}")
             return 0
 
+    @staticmethod
+    def _apply_team_change(player: Player, new_team: str) -> bool:
+        """
+        Move a player to new_team, remembering the old team in previous_team.
+        Returns True when the player actually changed teams.
+        """
+        changed = bool(player.team) and player.team != new_team
+        if changed:
+            player.previous_team = player.team
+        player.team = new_team
+        return changed
+
     async def fetch_espn_positions(self, db: AsyncSession, year: int = 2026):
         """Fetch position eligibility from ESPN Fantasy API."""
         logger.info(f"Fetching ESPN {year} position eligibility")
@@ -2410,15 +2437,15 @@ class DataSyncService:
         """Convert FanGraphs grade string (e.g., '55+', '60') to integer."""
         if grade_str is None:
             return None
+        if isinstance(grade_str, int) and not isinstance(grade_str, bool):
+            return grade_str
 
-        grade_str = str(grade_str).strip()
-        if not grade_str:
-            return None
-
-        # Remove + or - suffixes and convert
+        # Handle "55+" -> 55, "40-" -> 40
+        cleaned = str(grade_str).strip().rstrip("+-")
+        if cleaned.isascii() and cleaned.isdigit():
+            return int(cleaned)
+        # Rare forms int() still accepts: "55 +", "+55", "5_5"
         try:
-            # Handle "55+" -> 55, "40-" -> 40
-            cleaned = grade_str.rstrip("+-")
             return int(cleaned)
         except ValueError:
             return None
@@ -2787,8 +2814,7 @@ class DataSyncService:
                     "old": player.team,
                     "new": mlb_info["team"],
                 }
-                player.previous_team = player.team
-                player.team = mlb_info["team"]
+                self._apply_team_change(player, mlb_info["team"])
 
             # --- Position check ---
             mlb_raw_pos = mlb_info["position"]
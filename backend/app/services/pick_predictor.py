@@ -4,15 +4,16 @@ Pick Predictor - Monte Carlo Simulation Engine
 Runs Monte Carlo simulations to predict the probability that a player
 will still be available at the user's next pick in a snake draft.
 """
-import random
 from dataclasses import dataclass
 from typing import List, Set, Tuple, Optional
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class PredictionResult:
     """Result of a pick availability prediction."""
     player_id: int
@@ -22,13 +23,22 @@ class PredictionResult:
     current_pick: int
     picks_between: int
     probability: float  # 0.0 to 1.0
-    probability_pct: str  # "12.3%"
     simulations_run: int
     expected_draft_position: float
     volatility_score: float
     verdict: str  # "Likely Available", "Risky", "Unlikely"
     confidence: str  # "High", "Medium", "Low"
 
+    @property
+    def probability_pct(self) -> str:
+        """Probability as a display percentage, e.g. "12%", "0.4%", "<0.1%"."""
+        pct_value = self.probability * 100
+        if pct_value >= 1:
+            return f"{pct_value:.0f}%"
+        if pct_value >= 0.1:
+            return f"{pct_value:.1f}%"
+        return "<0.1%" if self.probability > 0 else "0%"
+
 
 class PickPredictor:
     """
@@ -43,6 +53,8 @@ class PickPredictor:
     DEFAULT_SIMULATIONS = 5000
     MAX_SIMULATIONS = 10000
     MIN_SIMULATIONS = 1000
+    # Upper bound on simulated positions held in memory at once
+    MAX_BATCH_CELLS = 1_000_000
 
     def __init__(self, num_simulations: int = DEFAULT_SIMULATIONS):
         """
@@ -68,6 +80,7 @@ class PickPredictor:
         num_teams: int,
         already_drafted_ids: Set[int],
         all_players_adp: List[Tuple[int, float, float]],  # (id, adp, volatility)
+        rng: Optional[np.random.Generator] = None,
     ) -> PredictionResult:
         """
         Run Monte Carlo simulations to predict if player survives to target_pick.
@@ -82,6 +95,8 @@ class PickPredictor:
             num_teams: Number of teams in the draft (used to adjust confidence by turn distance)
             already_drafted_ids: Set of player IDs already drafted
             all_players_adp: List of (player_id, adp, volatility) for all available players
+            rng: NumPy random generator for the simulations; a freshly seeded
+                 ``np.random.default_rng()`` when omitted
 
         Returns:
             PredictionResult with probability and analysis
@@ -100,7 +115,6 @@ class PickPredictor:
                 current_pick=current_pick,
                 picks_between=0,
                 probability=1.0,
-                probability_pct="100%",
                 simulations_run=0,
                 expected_draft_position=player_adp,
                 volatility_score=player_volatility,
@@ -118,7 +132,6 @@ class PickPredictor:
                 current_pick=current_pick,
                 picks_between=picks_between,
                 probability=0.0,
-                probability_pct="0%",
                 simulations_run=0,
                 expected_draft_position=0,
                 volatility_score=player_volatility,
@@ -132,23 +145,18 @@ class PickPredictor:
             if pid not in already_drafted_ids and adp is not None
         ]
 
-        # Run simulations
-        available_count = 0
-        draft_position_sum = 0.0
-        simulated_positions_count = 0
-
-        for _ in range(self.num_simulations):
-            sim_available, sim_position = self._run_simulation(
-                available_players,
-                player_id,
-                picks_between,
-                current_pick
+        if any(pid == player_id for pid, _, _ in available_players):
+            # Run simulations on parallel id/adp/volatility arrays
+            ids, adps, vols = np.array(available_players, dtype=np.float64).reshape(-1, 3).T
+            available_count, draft_position_sum, simulated_positions_count = self._run_simulations(
+                ids, adps, vols, player_id, picks_between,
+                rng if rng is not None else np.random.default_rng(),
             )
-            if sim_available:
-                available_count += 1
-            if sim_position is not None:
-                draft_position_sum += sim_position
-                simulated_positions_count += 1
+            simulations_run = self.num_simulations
+        else:
+            # Target isn't in the pool (e.g. no ADP data): no simulation can place them
+            available_count, draft_position_sum, simulated_positions_count = 0, 0.0, 0
+            simulations_run = 0
 
         # Calculate results
         probability = available_count / self.num_simulations
@@ -187,15 +195,6 @@ class PickPredictor:
             elif base_confidence == "Medium":
                 confidence = "Low"
 
-        # Format probability as percentage
-        pct_value = probability * 100
-        if pct_value >= 1:
-            probability_pct = f"{pct_value:.0f}%"
-        elif pct_value >= 0.1:
-            probability_pct = f"{pct_value:.1f}%"
-        else:
-            probability_pct = "<0.1%" if probability > 0 else "0%"
-
         return PredictionResult(
             player_id=player_id,
             player_name=player_name,
@@ -204,78 +203,66 @@ class PickPredictor:
             current_pick=current_pick,
             picks_between=picks_between,
             probability=probability,
-            probability_pct=probability_pct,
-            simulations_run=self.num_simulations,
+            simulations_run=simulations_run,
             expected_draft_position=round(expected_position, 1),
             volatility_score=round(player_volatility, 1),
             verdict=verdict,
             confidence=confidence
         )
 
-    def _run_simulation(
+    def _run_simulations(
         self,
-        players_adp: List[Tuple[int, float, float]],
+        ids: np.ndarray,
+        adps: np.ndarray,
+        vols: np.ndarray,
         target_player_id: int,
         picks_to_simulate: int,
-        current_pick: int
-    ) -> Tuple[bool, Optional[float]]:
+        rng: np.random.Generator,
+    ) -> Tuple[int, float, int]:
         """
-        Run a single simulation.
+        Run every simulation, vectorized over players and simulations.
 
+        Per simulation:
         1. For each player, generate draft position = ADP + random(+/- volatility)
-        2. Sort players by simulated position
-        3. "Draft" players in order until target_pick is reached
-        4. Return True if target_player is still available
+        2. Order players by simulated position ("drafted" earliest first)
+        3. The target is available if fewer than picks_to_simulate players
+           go before them
+
+        Only the target's rank is needed, so instead of sorting each
+        simulation we count the players drafted ahead of the target.  Ties
+        go to the player listed first, as a stable sort would order them.
 
         Args:
-            players_adp: List of (player_id, adp, volatility)
-            target_player_id: ID of player we're checking
+            ids, adps, vols: Parallel arrays of available players
+            target_player_id: ID of player we're checking (must be in ids)
             picks_to_simulate: Number of picks before user's turn
-            current_pick: Current pick number
+            rng: Random generator for this prediction
 
         Returns:
-            Tuple of (is_available, simulated_draft_position)
+            Tuple of (simulations where available, sum of target's simulated
+            positions, number of simulations that placed the target)
         """
-        # Generate simulated draft positions for all players
-        simulated_positions = []
-        target_sim_position = None
-
-        for player_id, adp, volatility in players_adp:
-            # Use normal distribution around ADP
-            # Clamp volatility to minimum of 1 to avoid zero std dev
-            vol = max(1.0, volatility)
-            sim_position = random.gauss(adp, vol)
-
-            # Clamp to reasonable range (can't go before pick 1 or negative)
-            sim_position = max(1.0, sim_position)
-
-            simulated_positions.append((player_id, sim_position))
-
-            if player_id == target_player_id:
-                target_sim_position = sim_position
-
-        # Sort by simulated draft position (earliest first)
-        simulated_positions.sort(key=lambda x: x[1])
-
-        # Check where target player falls in the simulated order
-        # Players are "drafted" in order of simulated position
-        for i, (player_id, sim_pos) in enumerate(simulated_positions):
-            # The i-th best player gets picked at pick (current_pick + i)
-            pick_number = current_pick + i
-
-            if player_id == target_player_id:
-                # This is our target player
-                # They're available if their simulated pick is >= target pick
-                # (they haven't been taken before our turn)
-                if pick_number >= current_pick + picks_to_simulate:
-                    # Player makes it to our pick
-                    return True, sim_pos
-                else:
-                    # Player gets taken before our pick
-                    return False, sim_pos
-
-        # Target player not found (shouldn't happen)
-        return False, target_sim_position
+        target_idx = np.flatnonzero(ids == target_player_id)[0]
+
+        # Clamp volatility to minimum of 1 to avoid zero std dev
+        vols = np.maximum(vols, 1.0)
+        listed_before = np.arange(ids.size) < target_idx
+
+        available_count = 0
+        position_sum = 0.0
+        batch = max(1, self.MAX_BATCH_CELLS // max(ids.size, 1))
+        for start in range(0, self.num_simulations, batch):
+            size = min(batch, self.num_simulations - start)
+            # Use normal distribution around ADP, clamped so nobody goes before pick 1
+            sims = np.maximum(rng.normal(adps, vols, size=(size, ids.size)), 1.0)
+            target_pos = sims[:, target_idx:target_idx + 1]
+            ahead = (sims < target_pos) | ((sims == target_pos) & listed_before)
+            picks_ahead = ahead.sum(axis=1)
+
+            available_count += int(np.count_nonzero(picks_ahead >= picks_to_simulate))
+            position_sum += float(target_pos.sum())
+
+        return available_count, position_sum, self.num_simulations
 
 
 def get_player_volatility(
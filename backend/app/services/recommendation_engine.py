@@ -29,6 +29,23 @@ ELITE_TIER_SIZE = {
 }
 
 
+def _mean_and_stdev(values: List[float]) -> Tuple[float, float]:
+    """
+    Mean and sample standard deviation in one pass (Welford's algorithm).
+
+    Plain float arithmetic: statistics.mean/stdev compute exactly with
+    Fractions, which costs tens of microseconds on a three-item list.
+    Callers guarantee at least two values.
+    """
+    mean = 0.0
+    m2 = 0.0
+    for n, value in enumerate(values, 1):
+        delta = value - mean
+        mean += delta / n
+        m2 += (value - mean) * delta
+    return mean, (m2 / (len(values) - 1)) ** 0.5
+
+
 @dataclass
 class ProspectRiskAssessment:
     """Detailed risk assessment for prospects."""
@@ -432,7 +449,7 @@ class RecommendationEngine:
         if rank_variance_score > 50:
             rankings = [r.overall_rank for r in player.rankings if r.overall_rank]
             if len(rankings) >= 2:
-                std_dev = statistics.stdev(rankings)
+                _, std_dev = _mean_and_stdev(rankings)
                 factors.append(f"High ranking variance (std dev: {std_dev:.1f})")
 
         # 2. Injury History
@@ -513,8 +530,7 @@ class RecommendationEngine:
         if len(rankings) < 2:
             return 50  # Default moderate - no data to assess
 
-        std_dev = statistics.stdev(rankings)
-        mean_rank = statistics.mean(rankings)
+        mean_rank, std_dev = _mean_and_stdev(rankings)
 
         # Base score: std_dev * 4 (capped at 100)
         # This means std_dev of 25 = 100 risk (very high disagreement)
@@ -599,39 +615,46 @@ class RecommendationEngine:
 
     def _experience_risk_from_pa(self, pa: int) -> float:
         """Convert career plate appearances to experience risk score."""
-        if pa >= settings.proven_career_pa:  # 1100+ PA
-            # Proven: 0-10 risk
-            return max(0, 10 - ((pa - settings.proven_career_pa) / 100))
-        elif pa >= settings.established_career_pa:  # 550+ PA
-            # Established: 10-30 risk
-            ratio = (settings.proven_career_pa - pa) / (settings.proven_career_pa - settings.established_career_pa)
-            return 10 + (ratio * 20)
-        elif pa >= settings.limited_career_pa:  # 200+ PA
-            # Limited: 30-60 risk
-            ratio = (settings.established_career_pa - pa) / (settings.established_career_pa - settings.limited_career_pa)
-            return 30 + (ratio * 30)
-        else:
-            # Rookie: 60-90 risk
-            ratio = max(0, (settings.limited_career_pa - pa) / settings.limited_career_pa)
-            return 60 + (ratio * 30)
+        return self._experience_risk_from_volume(
+            pa,
+            proven=settings.proven_career_pa,  # 1100+ PA
+            established=settings.established_career_pa,  # 550+ PA
+            limited=settings.limited_career_pa,  # 200+ PA
+            proven_decay=100,
+        )
 
     def _experience_risk_from_ip(self, ip: float) -> float:
         """Convert career innings pitched to experience risk score."""
-        if ip >= settings.proven_career_ip:  # 340+ IP
-            # Proven: 0-10 risk
-            return max(0, 10 - ((ip - settings.proven_career_ip) / 50))
-        elif ip >= settings.established_career_ip:  # 170+ IP
-            # Established: 10-30 risk
-            ratio = (settings.proven_career_ip - ip) / (settings.proven_career_ip - settings.established_career_ip)
-            return 10 + (ratio * 20)
-        elif ip >= settings.limited_career_ip:  # 60+ IP
-            # Limited: 30-60 risk
-            ratio = (settings.established_career_ip - ip) / (settings.established_career_ip - settings.limited_career_ip)
-            return 30 + (ratio * 30)
-        else:
-            # Rookie: 60-90 risk
-            ratio = max(0, (settings.limited_career_ip - ip) / settings.limited_career_ip) if settings.limited_career_ip > 0 else 1
-            return 60 + (ratio * 30)
+        return self._experience_risk_from_volume(
+            ip,
+            proven=settings.proven_career_ip,  # 340+ IP
+            established=settings.established_career_ip,  # 170+ IP
+            limited=settings.limited_career_ip,  # 60+ IP
+            proven_decay=50,
+        )
+
+    @staticmethod
+    def _experience_risk_from_volume(
+        volume: float,
+        proven: float,
+        established: float,
+        limited: float,
+        proven_decay: float,
+    ) -> float:
+        """
+        Shared tier ladder for PA/IP experience risk.
+
+        Each tier interpolates linearly across its band:
+        Proven 0-10, Established 10-30, Limited 30-60, Rookie 60-90.
+        """
+        if volume >= proven:
+            return max(0, 10 - ((volume - proven) / proven_decay))
+        if volume >= established:
+            return 10 + ((proven - volume) / (proven - established)) * 20
+        if volume >= limited:
+            return 30 + ((established - volume) / (established - limited)) * 30
+        ratio = max(0, (limited - volume) / limited) if limited > 0 else 1
+        return 60 + (ratio * 30)
 
     def _calculate_projection_variance(self, player: Player) -> float:
         """How much do projection systems disagree?"""
@@ -863,17 +886,18 @@ class RecommendationEngine:
         """Get safe pick recommendations."""
         safe_players = []
 
-        for player in players:
+        # Walk the pool in consensus-rank order and stop at `limit` safe players,
+        # rather than scoring every player and sorting the safe ones afterwards.
+        for player in sorted(players, key=lambda p: p.consensus_rank or 999):
+            if len(safe_players) >= limit:
+                break
             assessment = self.calculate_risk_score(player)
             if assessment.classification == "safe":
                 safe_players.append((player, assessment))
 
-        # Sort by consensus rank
-        safe_players.sort(key=lambda x: x[0].consensus_rank or 999)
-
         return [
             self._create_safe_response(player, assessment)
-            for player, assessment in safe_players[:limit]
+            for player, assessment in safe_players
         ]
 
     def get_risky_picks(
@@ -1327,8 +1351,7 @@ class RecommendationEngine:
         if len(rankings) < 2:
             return 50
 
-        std_dev = statistics.stdev(rankings)
-        mean_rank = statistics.mean(rankings)
+        mean_rank, std_dev = _mean_and_stdev(rankings)
 
         # Lower variance = higher consensus score
         # CV (coefficient of variation) under 0.1 is excellent consensus
@@ -5,10 +5,13 @@ Calculates z-scores for each player's projected stats, determines
 replacement-level baselines per position, and computes surplus value.
 """
 
-import statistics
+import heapq
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from app.config import settings
 from app.models import Player
 
@@ -172,62 +175,26 @@ class VORPCalculator:
             counting_cats = BATTER_COUNTING_CATS
             rate_cats = BATTER_RATE_CATS
             volume_key = "pa"
+        cats = counting_cats + rate_cats
+
+        # One row per player, one column per category
+        projs = [avg_proj for _, avg_proj in pool.values()]
+        stats = np.array([[proj.get(cat, 0.0) for cat in cats] for proj in projs])
+        volume = np.array([proj.get(volume_key, 0.0) for proj in projs])
+
+        # Rate stats count as contribution = rate * volume
+        stats[:, len(counting_cats):] *= volume[:, None]
+
+        # Z-score every column at once; a column where all players tie scores 0
+        deviations = stats - stats.mean(axis=0)
+        stdev = stats.std(axis=0, ddof=1)
+        varies = stats.max(axis=0) != stats.min(axis=0)
+        z = np.divide(deviations, stdev, out=np.zeros_like(stats), where=varies)
 
-        # Collect raw values for counting stats
-        counting_values: Dict[str, List[Tuple[int, float]]] = {
-            cat: [] for cat in counting_cats
-        }
-        for pid, (_, avg_proj) in pool.items():
-            for cat in counting_cats:
-                val = avg_proj.get(cat, 0.0)
-                counting_values[cat].append((pid, val))
-
-        # Collect contribution values for rate stats
-        rate_values: Dict[str, List[Tuple[int, float]]] = {
-            cat: [] for cat in rate_cats
-        }
-        for pid, (_, avg_proj) in pool.items():
-            volume = avg_proj.get(volume_key, 0.0)
-            for cat in rate_cats:
-                rate = avg_proj.get(cat, 0.0)
-                # Contribution = rate * volume
-                contribution = rate * volume
-                rate_values[cat].append((pid, contribution))
-
-        # Z-score each category
-        result: Dict[int, Dict[str, float]] = {pid: {} for pid in pool}
-
-        for cat in counting_cats:
-            z_map = self._z_score_list(counting_values[cat])
-            for pid, z in z_map.items():
-                result[pid][cat] = z
-
-        for cat in rate_cats:
-            z_map = self._z_score_list(rate_values[cat])
-            for pid, z in z_map.items():
-                # Invert ERA and WHIP so lower = better
-                if cat in ("era", "whip"):
-                    result[pid][cat] = -z
-                else:
-                    result[pid][cat] = z
-
-        return result
-
-    def _z_score_list(
-        self, values: List[Tuple[int, float]]
-    ) -> Dict[int, float]:
-        """Z-score a list of (player_id, value) tuples."""
-        if len(values) < 2:
-            return {pid: 0.0 for pid, _ in values}
-
-        raw = [v for _, v in values]
-        mean = statistics.mean(raw)
-        stdev = statistics.stdev(raw)
-
-        if stdev == 0:
-            return {pid: 0.0 for pid, _ in values}
-
-        return {pid: (val - mean) / stdev for pid, val in values}
+        # Invert ERA and WHIP so lower = better
+        z *= [-1.0 if cat in ("era", "whip") else 1.0 for cat in cats]
+
+        return {pid: dict(zip(cats, row)) for pid, row in zip(pool, z.tolist())}
 
     def _calculate_replacement_levels(
         self,
@@ -245,26 +212,27 @@ class VORPCalculator:
         roster_slots = settings.roster_slots
         replacement_levels: Dict[str, float] = {}
 
+        # Bucket z-scores by eligible position in one pass over the pool
+        eligible: Dict[str, List[float]] = defaultdict(list)
+        for player in players:
+            if player.id not in total_z:
+                continue
+            positions = set((player.positions or "").replace(",", "/").split("/"))
+            positions.add(player.primary_position)
+            z = total_z[player.id]
+            for pos in FIELD_POSITIONS:
+                if pos in positions:
+                    eligible[pos].append(z)
+
         for pos in FIELD_POSITIONS:
             slots = roster_slots.get(pos, 1)
             repl_index = (num_teams * slots) + 2
 
-            # Find all players eligible at this position, sorted by z desc
-            eligible = []
-            for player in players:
-                if player.id not in total_z:
-                    continue
-                positions = (player.positions or "").replace(",", "/")
-                if pos in positions.split("/") or player.primary_position == pos:
-                    eligible.append((player.id, total_z[player.id]))
-
-            eligible.sort(key=lambda x: x[1], reverse=True)
-
-            if repl_index < len(eligible):
-                replacement_levels[pos] = eligible[repl_index][1]
-            elif eligible:
-                # Not enough players — use the worst available
-                replacement_levels[pos] = eligible[-1][1]
+            # Only the top repl_index + 1 z-scores matter; when the position
+            # is thinner than that, the last one is the worst available.
+            pos_z = eligible[pos]
+            if pos_z:
+                replacement_levels[pos] = heapq.nlargest(repl_index + 1, pos_z)[-1]
             else:
                 replacement_levels[pos] = 0.0
 
@@ -2,8 +2,41 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timezone
+
+
+# Generational suffixes dropped by normalize_name (after lowercasing); the tuple
+# feeds str.endswith, the frozenset checks the final word
+_NAME_SUFFIXES = ("jr.", "sr.", "iii", "jr", "sr", "ii", "iv")
+_NAME_SUFFIX_WORDS = frozenset(_NAME_SUFFIXES)
+
+# Non-ASCII characters, each folded to its unaccented form by normalize_name
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
+
+# sanitize_error_message: file paths, line numbers, database URLs
+_ERROR_FILE_PATH_RE = re.compile(r'/[^\s]+\.py')
+_ERROR_LINE_NO_RE = re.compile(r'line \d+')
+_ERROR_DB_URL_RE = re.compile(r'sqlite:///[^\s]+')
+
+# SQL fragments rejected by validate_search_query, matched against the uppercased query
+_DANGEROUS_QUERY_RE = re.compile(r'--|;|DROP|DELETE|UPDATE|INSERT|UNION')
+
+# Runs of characters that become a single hyphen in a FantasyPros slug
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-z0-9]+')
+
+
+@lru_cache(maxsize=1024)
+def _strip_accents(char: str) -> str:
+    """Decompose a single character and drop its combining marks."""
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', char) if unicodedata.category(c) != 'Mn'
+    )
+
+
+def _strip_accents_match(match: "re.Match[str]") -> str:
+    return _strip_accents(match.group())
 
 
 def normalize_name(name: str) -> str:
@@ -23,15 +56,20 @@ def normalize_name(name: str) -> str:
     """
     if not name:
         return ""
-    # Remove accents
-    normalized = unicodedata.normalize('NFD', name)
-    without_accents = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
+    # Remove accents; ASCII names (most of them) have none, so skip the scan.
+    # Only the non-ASCII characters are decomposed, each one through a cache.
+    if not name.isascii():
+        name = _NON_ASCII_RE.sub(_strip_accents_match, name)
     # Lowercase and strip
-    result = without_accents.lower().strip()
+    result = name.lower().strip()
     # Treat hyphens as spaces so "Crow-Armstrong" == "Crow Armstrong"
     result = result.replace('-', ' ')
-    # Remove common suffixes for better matching
-    result = re.sub(r'\s+(jr\.?|sr\.?|ii|iii|iv)$', '', result, flags=re.IGNORECASE)
+    # Remove common suffixes for better matching; the suffix must be its own word.
+    # One endswith() over the whole tuple rules out the usual no-suffix case.
+    if result.endswith(_NAME_SUFFIXES):
+        parts = result.rsplit(None, 1)
+        if len(parts) == 2 and parts[1] in _NAME_SUFFIX_WORDS:
+            return parts[0]
     return result
 
 
@@ -49,11 +87,11 @@ def sanitize_error_message(error: Exception) -> str:
     """
     error_str = str(error)
     # Remove file paths
-    error_str = re.sub(r'/[^\s]+\.py', '[file]', error_str)
+    error_str = _ERROR_FILE_PATH_RE.sub('[file]', error_str)
     # Remove line numbers
-    error_str = re.sub(r'line \d+', 'line [num]', error_str)
+    error_str = _ERROR_LINE_NO_RE.sub('line [num]', error_str)
     # Remove database connection strings
-    error_str = re.sub(r'sqlite:///[^\s]+', '[database]', error_str)
+    error_str = _ERROR_DB_URL_RE.sub('[database]', error_str)
     # Truncate long messages
     if len(error_str) > 200:
         error_str = error_str[:200] + '...'
@@ -83,11 +121,8 @@ def validate_search_query(query: str, max_length: int = 100) -> str:
         raise ValueError(f"Search query too long (max {max_length} characters)")
 
     # Remove potentially dangerous SQL patterns (extra safety layer)
-    dangerous_patterns = ['--', ';', 'DROP', 'DELETE', 'UPDATE', 'INSERT', 'UNION']
-    query_upper = query.upper()
-    for pattern in dangerous_patterns:
-        if pattern in query_upper:
-            raise ValueError("Invalid characters in search query")
+    if _DANGEROUS_QUERY_RE.search(query.upper()):
+        raise ValueError("Invalid characters in search query")
 
     return query
 
@@ -124,10 +159,14 @@ def transform_ranking_response(ranking, player_name: str) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=4096)
 def generate_fantasypros_player_url(player_name: str) -> str:
     """
     Generate a FantasyPros player page URL from player name.
 
+    Pure function of the name, so results are memoized; a player's rankings
+    usually include several FantasyPros sources that all need the same URL.
+
     Args:
         player_name: The player's full name
 
@@ -142,7 +181,7 @@ def generate_fantasypros_player_url(player_name: str) -> str:
     # Normalize suffixes: "Jr." -> "jr", "Sr." -> "sr" (keep them, just remove periods)
     slug = slug.replace('.', '')
     # Replace spaces and special chars with hyphens
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
+    slug = _SLUG_SEPARATOR_RE.sub('-', slug)
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
     return f"https://www.fantasypros.com/mlb/players/{slug}.php"
@@ -193,23 +232,43 @@ async def find_player_by_name(db, name: str, player_model):
     return None
 
 
-def calculate_age_from_birthdate(birth_date: datetime) -> int:
+def calculate_age_from_birthdate(birth_date: datetime, today: Optional[datetime] = None) -> int:
     """
     Calculate current age from a birth date.
 
     Args:
         birth_date: The person's birth date
+        today: Reference date (defaults to now)
 
     Returns:
-        Current age in years
+        Age in years as of ``today``
     """
-    today = datetime.now()
+    today = today or datetime.now()
     age = today.year - birth_date.year
     if (today.month, today.day) < (birth_date.month, birth_date.day):
         age -= 1
     return age
 
 
+def birth_date_from_epoch_ms(ms: Optional[int]) -> Optional[datetime]:
+    """
+    Convert an epoch-milliseconds birth date (as ESPN reports it) to a naive
+    UTC datetime.
+
+    Args:
+        ms: Milliseconds since the Unix epoch, or None
+
+    Returns:
+        The birth date, or None if missing or out of range
+    """
+    if not ms:
+        return None
+    try:
+        return datetime.fromtimestamp(ms / 1000, tz=timezone.utc).replace(tzinfo=None)
+    except (ValueError, OSError, OverflowError):
+        return None
+
+
 def clean_numeric_string(value: str) -> float:
     """
     Clean a numeric string by removing commas and converting to float.
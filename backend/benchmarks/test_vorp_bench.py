@@ -0,0 +1,56 @@
+"""
+Timing benchmarks for VORPCalculator.calculate_all_vorp.
+
+Run explicitly (pytest-benchmark turns itself off under xdist):
+
+    pytest benchmarks -n 0
+
+The default ``pytest`` run only collects ``tests/``, so these never slow it down.
+"""
+
+from typing import NamedTuple
+
+import pytest
+
+from app.services.vorp_calculator import VORPCalculator
+from conftest import ProjectionStub
+
+
+class _Player(NamedTuple):
+    id: int
+    primary_position: str
+    positions: str
+    projections: list
+
+
+# Roughly a draft pool's position mix: 8 batters for every 3 pitchers
+_POSITIONS = ("C", "1B", "2B", "3B", "SS", "OF", "OF", "OF", "SP", "SP", "RP")
+
+
+def _make_pool(n):
+    """n players with stats graded by index, so every category has spread."""
+    players = []
+    for i in range(n):
+        pos = _POSITIONS[i % len(_POSITIONS)]
+        step = i % 40
+        if pos in ("SP", "RP"):
+            proj = ProjectionStub(
+                ip=180 - step * 3, strikeouts=220 - step * 4, era=2.8 + step * 0.05,
+                whip=1.00 + step * 0.01, wins=15 - step // 4, quality_starts=22 - step // 3,
+                saves=30 - step // 2 if pos == "RP" else 0,
+            )
+        else:
+            proj = ProjectionStub(
+                pa=650 - step * 5, hr=40 - step // 2, rbi=110 - step * 2, sb=25 - step // 2,
+                avg=0.300 - step * 0.002, runs=105 - step * 2, ops=0.950 - step * 0.006,
+            )
+        players.append(_Player(i + 1, pos, pos, [proj]))
+    return players
+
+
+@pytest.mark.parametrize("num_teams", [8, 12, 14])
+@pytest.mark.parametrize("n", [25, 100, 400, 1600])
+def test_vorp_scaling(benchmark, n, num_teams):
+    pool = _make_pool(n)
+    results = benchmark(VORPCalculator().calculate_all_vorp, pool, num_teams=num_teams)
+    assert len(results) == n
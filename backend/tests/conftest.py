@@ -1,10 +1,22 @@
 """
 Pytest fixtures for Fantasy Baseball Draft Assistant tests.
 """
+import os
+
 import pytest
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
 from unittest.mock import MagicMock
+from uuid import uuid4
+
+from sqlalchemy import create_mock_engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 — registers all models with Base
+from app.database import Base
+from app.services.recommendation_engine import RecommendationEngine
 
 
 class MockRankingSource:
@@ -65,6 +77,25 @@ class MockPlayerProjection:
         self.quality_starts = quality_starts
 
 
+class ProjectionStub(NamedTuple):
+    """Projection for the VORP tests and benchmarks; every stat is 0.0 unless set."""
+
+    pa: float = 0.0
+    ip: float = 0.0
+    hr: float = 0.0
+    rbi: float = 0.0
+    sb: float = 0.0
+    avg: float = 0.0
+    runs: float = 0.0
+    ops: float = 0.0
+    strikeouts: float = 0.0
+    era: float = 0.0
+    whip: float = 0.0
+    wins: float = 0.0
+    saves: float = 0.0
+    quality_starts: float = 0.0
+
+
 class MockPlayerNews:
     """Mock PlayerNews for testing."""
     def __init__(self, is_injury_related: bool = False, headline: str = "Test news"):
@@ -127,15 +158,45 @@ class MockPlayer:
         self.previous_team = previous_team
 
 
+def assert_unique(items) -> None:
+    """Assert an iterable has no repeated values, failing on the first repeat."""
+    seen = set()
+    for item in items:
+        assert item not in seen, f"duplicate: {item!r}"
+        seen.add(item)
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """Session-wide RecommendationEngine.
+
+    Its risk cache is kept across tests: mock players get unique ids and the
+    cache key covers the attributes that feed the score, so a player scored
+    by one test is served from the cache when another test scores it again.
+    """
+    return RecommendationEngine()
+
+
 @pytest.fixture
+def fresh_engine():
+    """A RecommendationEngine of the test's own, for tests that poke at its internals."""
+    return RecommendationEngine()
+
+
+@pytest.fixture(scope="session")
 def mock_player_factory():
-    """Factory fixture for creating mock players with custom attributes."""
+    """Factory fixture for creating mock players with custom attributes.
+
+    The named player fixtures below are built once per session and shared
+    read-only; tests that mutate a player build their own through this
+    factory, which returns a new MockPlayer on every call.
+    """
     def _create_player(**kwargs) -> MockPlayer:
         return MockPlayer(**kwargs)
     return _create_player
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_with_consistent_rankings(mock_player_factory):
     """Player with low ranking variance (safe pick)."""
     return mock_player_factory(
@@ -152,7 +213,7 @@ def player_with_consistent_rankings(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_with_high_variance(mock_player_factory):
     """Player with high ranking variance (risky pick)."""
     return mock_player_factory(
@@ -170,7 +231,7 @@ def player_with_high_variance(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_injured_il60(mock_player_factory):
     """Player with severe IL-60 injury."""
     return mock_player_factory(
@@ -184,7 +245,7 @@ def player_injured_il60(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_injured_il10(mock_player_factory):
     """Player with minor IL-10 injury."""
     return mock_player_factory(
@@ -198,7 +259,7 @@ def player_injured_il10(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_injured_dtd(mock_player_factory):
     """Player with day-to-day status."""
     return mock_player_factory(
@@ -211,7 +272,7 @@ def player_injured_dtd(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_rookie(mock_player_factory):
     """Rookie with limited MLB experience."""
     return mock_player_factory(
@@ -226,7 +287,7 @@ def player_rookie(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_veteran_hitter(mock_player_factory):
     """Established veteran hitter."""
     return mock_player_factory(
@@ -243,7 +304,7 @@ def player_veteran_hitter(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_starting_pitcher(mock_player_factory):
     """Starting pitcher with proven track record."""
     return mock_player_factory(
@@ -261,7 +322,7 @@ def player_starting_pitcher(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_relief_pitcher(mock_player_factory):
     """Relief pitcher / closer."""
     return mock_player_factory(
@@ -278,7 +339,7 @@ def player_relief_pitcher(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def player_with_injury_news(mock_player_factory):
     """Player with multiple injury-related news items."""
     return mock_player_factory(
@@ -297,7 +358,13 @@ def player_with_injury_news(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def ten_injury_news():
+    """Ten injury-related news items, enough to hit the news penalty cap."""
+    return tuple(MockPlayerNews(is_injury_related=True) for _ in range(10))
+
+
+@pytest.fixture(scope="session")
 def player_no_data(mock_player_factory):
     """Player with minimal data (edge case)."""
     return mock_player_factory(
@@ -308,7 +375,33 @@ def player_no_data(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def player_single_ranking(mock_player_factory):
+    """Player ranked by a single source (too few to measure variance)."""
+    return mock_player_factory(
+        name="Single Source",
+        rankings=[MockPlayerRanking(overall_rank=10)],
+    )
+
+
+@pytest.fixture(scope="session")
+def ten_safe_players(mock_player_factory):
+    """Ten top-ranked players with tight rankings (more safe picks than a limit allows)."""
+    return [
+        mock_player_factory(
+            name=f"Safe Player {i}",
+            consensus_rank=i + 1,
+            rankings=[
+                MockPlayerRanking(overall_rank=i + 1),
+                MockPlayerRanking(overall_rank=i + 2),
+            ],
+            projections=[MockPlayerProjection(pa=600)],
+        )
+        for i in range(10)
+    ]
+
+
+@pytest.fixture(scope="session")
 def player_adp_ecr_mismatch(mock_player_factory):
     """Player where ADP differs significantly from consensus rank."""
     return mock_player_factory(
@@ -324,7 +417,7 @@ def player_adp_ecr_mismatch(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def speed_specialist(mock_player_factory):
     """Player with elite stolen base potential."""
     return mock_player_factory(
@@ -340,7 +433,7 @@ def speed_specialist(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def power_specialist(mock_player_factory):
     """Player with elite home run potential."""
     return mock_player_factory(
@@ -359,7 +452,7 @@ def power_specialist(mock_player_factory):
 # ==================== NEW FIXTURES FOR AGE/EXPERIENCE TESTS ====================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def young_hitter_at_peak(mock_player_factory):
     """27-year-old hitter at peak age."""
     return mock_player_factory(
@@ -378,7 +471,7 @@ def young_hitter_at_peak(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aging_hitter_declining(mock_player_factory):
     """36-year-old hitter in decline."""
     return mock_player_factory(
@@ -397,7 +490,7 @@ def aging_hitter_declining(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def young_pitcher_pre_peak(mock_player_factory):
     """24-year-old pitcher before peak."""
     return mock_player_factory(
@@ -416,7 +509,7 @@ def young_pitcher_pre_peak(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aging_pitcher_high_risk(mock_player_factory):
     """34-year-old pitcher with injury risk."""
     return mock_player_factory(
@@ -435,7 +528,7 @@ def aging_pitcher_high_risk(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def proven_veteran_low_risk(mock_player_factory):
     """Veteran hitter with 2+ seasons of production (low experience risk)."""
     return mock_player_factory(
@@ -454,7 +547,7 @@ def proven_veteran_low_risk(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def established_player_medium_risk(mock_player_factory):
     """Player with 1 full season of production."""
     return mock_player_factory(
@@ -473,7 +566,7 @@ def established_player_medium_risk(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def limited_experience_player(mock_player_factory):
     """Player with limited MLB experience (200-550 PA)."""
     return mock_player_factory(
@@ -492,7 +585,7 @@ def limited_experience_player(mock_player_factory):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def true_rookie_high_risk(mock_player_factory):
     """Rookie with <200 career PA (highest experience risk)."""
     return mock_player_factory(
@@ -511,41 +604,157 @@ def true_rookie_high_risk(mock_player_factory):
     )
 
 
-@pytest.fixture
-def elite_low_variance(mock_player_factory):
-    """Elite player (top 10) with low ranking variance."""
-    return mock_player_factory(
-        name="Elite Consensus",
-        primary_position="OF",
-        age=28,
-        career_pa=3000,
-        consensus_rank=5,
-        rankings=[
-            MockPlayerRanking(overall_rank=4, adp=5.0),
-            MockPlayerRanking(overall_rank=5, adp=5.5),
-            MockPlayerRanking(overall_rank=6, adp=4.5),
-        ],
-        projections=[
-            MockPlayerProjection(pa=650, hr=40, sb=20, avg=0.300),
-        ],
-    )
+# ---------------------------------------------------------------------------
+# Lightweight stand-ins for app.main's lifespan dependencies
+# ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def late_round_high_variance(mock_player_factory):
-    """Late round player (rank 120+) with high variance."""
-    return mock_player_factory(
-        name="Late Lottery",
-        primary_position="3B",
-        age=27,
-        career_pa=400,
-        consensus_rank=130,
-        rankings=[
-            MockPlayerRanking(overall_rank=100, adp=140.0),
-            MockPlayerRanking(overall_rank=130, adp=130.0),
-            MockPlayerRanking(overall_rank=160, adp=150.0),
-        ],
-        projections=[
-            MockPlayerProjection(pa=450, hr=18, sb=5, avg=0.245),
-        ],
+class FakeStartupDB:
+    """Lifespan DB stand-in: reports a non-empty players table, so no auto-seed."""
+
+    async def scalar(self, *_args, **_kwargs):
+        return 1
+
+
+class FakeSessionCtx:
+    """Re-enterable async context manager yielding a FakeStartupDB.
+
+    Used as ``patch("app.main.async_session", return_value=FakeSessionCtx())``.
+    """
+
+    def __init__(self):
+        self.db = FakeStartupDB()
+
+    async def __aenter__(self):
+        return self.db
+
+    async def __aexit__(self, *_exc):
+        return False
+
+
+async def noop_init_db():
+    """Replaces app.main.init_db; test fixtures build their own schema."""
+
+
+# ---------------------------------------------------------------------------
+# In-memory SQLite helpers for DB-backed tests
+# ---------------------------------------------------------------------------
+
+
+def make_memory_engine() -> AsyncEngine:
+    """
+    Async engine on a uniquely named shared-cache in-memory SQLite DB.
+
+    StaticPool keeps its single connection (and so the DB) alive until the
+    engine is disposed.  The name carries the pytest-xdist worker id
+    (``PYTEST_XDIST_WORKER``, "main" without xdist) plus a uuid, so workers
+    and modules never share a database.
+    Engines live for a whole module, so the compiled-statement cache is sized
+    to hold every distinct query the endpoints issue.
+    Durability PRAGMAs are relaxed and pysqlite's implicit BEGIN is replaced
+    with an explicit one so SAVEPOINT-based rollback works.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    db_uri = f"file:db_{worker}_{uuid4().hex}?mode=memory&cache=shared&uri=true"
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_uri}",
+        connect_args={"uri": True},
+        poolclass=StaticPool,
+        query_cache_size=1200,
     )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_conn, _):
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=MEMORY")
+        cur.execute("PRAGMA synchronous=OFF")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.close()
+
+    use_explicit_begin(engine)
+    return engine
+
+
+def use_explicit_begin(engine: AsyncEngine) -> None:
+    """
+    Replace pysqlite's implicit BEGIN with an explicit one on ``engine``.
+
+    pysqlite otherwise defers BEGIN until the first write, which breaks the
+    SAVEPOINTs ``RollbackConnection`` relies on.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_conn, _):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+@lru_cache(maxsize=1)
+def schema_ddl() -> str:
+    """Base.metadata's CREATE TABLE/INDEX statements rendered once as one script."""
+    statements = []
+
+    def collect(ddl, *_args, **_kwargs):
+        statements.append(f"{ddl.compile(dialect=mock.dialect)};")
+
+    mock = create_mock_engine("sqlite://", collect)
+    Base.metadata.create_all(mock, checkfirst=False)
+    return "\n".join(statements)
+
+
+async def create_schema(engine: AsyncEngine) -> None:
+    """Create every table in one ``executescript`` call instead of ``create_all``."""
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.executescript(schema_ddl())
+
+
+async def build_memory_db(seed=None):
+    """
+    Fresh in-memory engine with the schema created and ``seed`` applied.
+
+    ``seed(sync_conn)`` runs inside one transaction via ``run_sync``.
+
+    Returns: (engine, seed's return value)
+    """
+    engine = make_memory_engine()
+    await create_schema(engine)
+    result = None
+    if seed is not None:
+        async with engine.begin() as conn:
+            result = await conn.run_sync(seed)
+    return engine, result
+
+
+class RollbackConnection:
+    """
+    One async connection per test, held in an outer transaction.
+
+    Request sessions join it with ``create_savepoint``, so route handlers'
+    ``commit()`` calls only release SAVEPOINTs; ``rollback()`` then discards
+    everything the test wrote.  From sync tests, run ``rollback`` with
+    ``asyncio.run``, even if a TestClient's portal loop opened the connection;
+    aiosqlite connections are not tied to one event loop.
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.conn = None
+        self.trans = None
+
+    async def session(self) -> AsyncSession:
+        if self.conn is None:
+            self.conn = await self.engine.connect()
+            self.trans = await self.conn.begin()
+        return AsyncSession(
+            bind=self.conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+
+    async def rollback(self) -> None:
+        if self.conn is not None:
+            await self.trans.rollback()
+            await self.conn.close()
+            self.conn = self.trans = None
@@ -2,14 +2,15 @@
 Tests for CategoryCalculator service.
 
 Two layers:
-  A. Pure unit tests (no DB) — TestGetPlayerContribution
+  A. Pure unit tests (no DB) — TestGetPlayerContribution, TestGetScaledTargets,
+                               TestNeedsFromStrengths
   B. DB integration tests   — TestTeamStrengths, TestTeamNeeds
 """
 
 import pytest
-from sqlalchemy import create_engine, select
+import pytest_asyncio
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from sqlalchemy.orm import Session
 
 import app.models  # noqa: F401 — registers all models with Base
 from app.database import Base
@@ -47,44 +48,64 @@ def _player_with_proj(**stats):
 
 
 # ---------------------------------------------------------------------------
-# DB fixture for integration tests
+# DB fixtures for integration tests
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-async def db_session(tmp_path):
+# DB tests share the module-scoped engine below, so they must run on the same
+# event loop that created it.
+module_loop = pytest.mark.asyncio(loop_scope="module")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def db_engine(tmp_path_factory):
     """
-    Async session backed by a fresh temp-file SQLite DB seeded with one League.
-    Function-scoped — each test gets a completely clean slate.
+    Module-scoped async engine on a temp-file SQLite DB seeded with one League.
+    Schema creation and the league insert run once for the whole module.
     """
-    db_path = str(tmp_path / "test_cat_calc.db")
-
-    # ── sync setup ────────────────────────────────────────────────────────
-    sync_engine = create_engine(f"sqlite:///{db_path}")
-    Base.metadata.create_all(sync_engine)
-    with Session(sync_engine) as sess:
-        league = League(espn_league_id=88, name="Cat League", year=2026)
-        sess.add(league)
-        sess.commit()
-    sync_engine.dispose()
-
-    # ── async session ─────────────────────────────────────────────────────
+    db_path = str(tmp_path_factory.mktemp("cat_calc") / "test_cat_calc.db")
+
     async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
     AsyncSess = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
-    async with AsyncSess() as session:
-        yield session
+    async with AsyncSess() as s:
+        s.add(League(espn_league_id=88, name="Cat League", year=2026))
+        await s.commit()
+
+    yield async_engine
 
     await async_engine.dispose()
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def league_id(db_engine) -> int:
+    """Primary key of the seeded League, looked up once per module."""
+    async with db_engine.connect() as conn:
+        result = await conn.execute(select(League.id))
+        return result.scalar_one()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def db_session(db_engine):
+    """
+    Async session bound to a connection-level transaction that is rolled back
+    after each test, so every test still sees only the seeded League.
+    """
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+
+
 # ---------------------------------------------------------------------------
 # DB helpers shared across integration tests
 # ---------------------------------------------------------------------------
 
-async def _get_league(session: AsyncSession) -> League:
-    result = await session.execute(select(League))
-    return result.scalars().first()
-
-
 async def _add_team(
     session: AsyncSession,
     league_id: int,
@@ -109,33 +130,58 @@ async def _add_player_with_pick(
     return (player, projection).  Each call must use a unique src_name within
     the same DB session (ProjectionSource.name has a unique constraint).
     """
-    src = ProjectionSource(name=src_name, projection_year=2026)
-    session.add(src)
-    await session.flush()
-
-    player = Player(
-        name=f"Player_{src_name}",
-        positions="OF",
-        primary_position="OF",
-        is_drafted=True,
+    [(player, proj)] = await _add_players_with_picks(
+        session, team_id, [{"src_name": src_name, **proj_stats}]
     )
-    session.add(player)
+    return player, proj
+
+
+async def _add_players_with_picks(
+    session: AsyncSession,
+    team_id: int,
+    specs: list[dict],
+):
+    """
+    Bulk variant of _add_player_with_pick.  Each spec is a dict with a
+    unique "src_name" plus projection stats.  Inserts everything in three
+    flushes regardless of len(specs) and returns [(player, projection), ...].
+    """
+    specs = [dict(spec) for spec in specs]
+    src_names = [spec.pop("src_name") for spec in specs]
+
+    sources = [ProjectionSource(name=name, projection_year=2026) for name in src_names]
+    session.add_all(sources)
     await session.flush()
 
-    proj = PlayerProjection(player_id=player.id, source_id=src.id, **proj_stats)
-    session.add(proj)
+    players = [
+        Player(
+            name=f"Player_{name}",
+            positions="OF",
+            primary_position="OF",
+            is_drafted=True,
+        )
+        for name in src_names
+    ]
+    session.add_all(players)
+    await session.flush()
 
-    pick = DraftPick(
-        team_id=team_id,
-        player_id=player.id,
-        round_num=1,
-        pick_num=1,
-        pick_in_round=1,
-    )
-    session.add(pick)
+    projections = []
+    picks = []
+    for src, player, proj_stats in zip(sources, players, specs):
+        projections.append(
+            PlayerProjection(player_id=player.id, source_id=src.id, **proj_stats)
+        )
+        picks.append(DraftPick(
+            team_id=team_id,
+            player_id=player.id,
+            round_num=1,
+            pick_num=1,
+            pick_in_round=1,
+        ))
+    session.add_all(projections + picks)
     await session.flush()
 
-    return player, proj
+    return list(zip(players, projections))
 
 
 # ===========================================================================
@@ -194,20 +240,99 @@ class TestGetPlayerContribution:
         assert contrib["hr"] == pytest.approx(25.0)  # mean(20, 30)
 
 
+# ===========================================================================
+# TestGetScaledTargets  (pure unit tests — no DB)
+# ===========================================================================
+
+class TestGetScaledTargets:
+    """Pure unit tests for CategoryCalculator.get_scaled_targets."""
+
+    def test_12_team_matches_baseline(self):
+        """A 12-team league uses LEAGUE_TARGETS unchanged."""
+        targets = CategoryCalculator().get_scaled_targets(num_teams=12)
+
+        for category, base in CategoryCalculator.LEAGUE_TARGETS.items():
+            assert targets[category] == pytest.approx(base)
+
+    @pytest.mark.parametrize("num_teams", [8, 10, 14, 16])
+    def test_counting_stats_scale_ratios_fixed(self, num_teams):
+        """Counting stats scale with league size; ERA/WHIP do not."""
+        targets = CategoryCalculator().get_scaled_targets(num_teams=num_teams)
+        scale = num_teams / 12.0
+
+        assert targets["hr"] == pytest.approx(CategoryCalculator.LEAGUE_TARGETS["hr"] * scale)
+        assert targets["era"] == pytest.approx(CategoryCalculator.LEAGUE_TARGETS["era"])
+        assert targets["whip"] == pytest.approx(CategoryCalculator.LEAGUE_TARGETS["whip"])
+
+    def test_overrides_take_precedence(self):
+        """Explicit overrides replace the scaled value, including ratio categories."""
+        targets = CategoryCalculator().get_scaled_targets(
+            num_teams=10, target_overrides={"hr": 300.0, "era": 3.50}
+        )
+
+        assert targets["hr"] == pytest.approx(300.0)
+        assert targets["era"] == pytest.approx(3.50)
+
+    def test_cached_result_not_shared(self):
+        """Mutating a returned dict must not leak into later (cached) calls."""
+        calc = CategoryCalculator()
+        first = calc.get_scaled_targets(num_teams=12)
+        first["hr"] = -1.0
+
+        assert calc.get_scaled_targets(num_teams=12)["hr"] == pytest.approx(
+            CategoryCalculator.LEAGUE_TARGETS["hr"]
+        )
+
+
+# ===========================================================================
+# TestNeedsFromStrengths  (pure unit tests — no DB)
+# ===========================================================================
+
+class TestNeedsFromStrengths:
+    """Pure unit tests for CategoryCalculator._needs_from_strengths."""
+
+    @pytest.mark.parametrize("strength,expected", [
+        (39.9, "high"),
+        (40.0, "medium"),
+        (54.9, "medium"),
+        (55.0, "low"),
+        (69.9, "low"),
+        (70.0, None),
+    ])
+    def test_priority_band_edges(self, strength, expected):
+        """Band edges are inclusive on the low side; 70+ is not a need."""
+        needs = CategoryCalculator()._needs_from_strengths({"hr": strength})
+
+        if expected is None:
+            assert needs == []
+        else:
+            assert [n["priority"] for n in needs] == [expected]
+
+    def test_sorted_weakest_first_with_gaps(self):
+        """Needs come back weakest-first; ratio categories carry no gap."""
+        needs = CategoryCalculator()._needs_from_strengths(
+            {"runs": 50.0, "hr": 25.0, "era": 30.0, "sb": 90.0}
+        )
+
+        assert [n["category"] for n in needs] == ["hr", "era", "runs"]
+        assert needs[0]["gap"] == pytest.approx(210.0)  # 280 * 0.75
+        assert needs[1]["gap"] == 0
+
+
 # ===========================================================================
 # TestTeamStrengths  (DB integration)
 # ===========================================================================
 
+@module_loop
 class TestTeamStrengths:
     """Integration tests for CategoryCalculator.get_team_strengths."""
 
-    async def test_empty_roster_returns_inverted_fallback(self, db_session):
+    async def test_empty_roster_returns_inverted_fallback(self, db_session, league_id):
         """
         No DraftPicks for a team → inverted categories (ERA, WHIP) fall back to
         50 per the explicit no-data guard; non-inverted counting stats return 0.
         """
-        league = await _get_league(db_session)
-        team = await _add_team(db_session, league.id)
+        team = await _add_team(db_session, league_id)
 
         calc = CategoryCalculator()
         strengths = await calc.get_team_strengths(db_session, team.id)
@@ -219,36 +344,31 @@ class TestTeamStrengths:
         assert strengths["hr"] == pytest.approx(0.0)
         assert strengths["runs"] == pytest.approx(0.0)
 
-    async def test_batting_stats_scale_proportionally(self, db_session):
-        """
-        Player with hr == LEAGUE_TARGETS['hr'] (280) → hr_strength == 100.
-        Verifies the (projected / target) * 100 scaling formula.
-        """
-        league = await _get_league(db_session)
-        team = await _add_team(db_session, league.id)
-        await _add_player_with_pick(db_session, team.id, hr=280.0)
-
-        calc = CategoryCalculator()
-        strengths = await calc.get_team_strengths(db_session, team.id)
-
-        assert strengths["hr"] == pytest.approx(100.0)
-
-    async def test_era_inverted_lower_is_better(self, db_session):
+    @pytest.mark.parametrize("stat,value,expected", [
+        # hr == LEAGUE_TARGETS['hr'] → (projected / target) * 100 == 100
+        ("hr", CategoryCalculator.LEAGUE_TARGETS["hr"], 100.0),
+        ("sb", CategoryCalculator.LEAGUE_TARGETS["sb"], 100.0),
+        ("saves", CategoryCalculator.LEAGUE_TARGETS["saves"], 100.0),
+        # Inverted: diff = 3.70 - 2.50 = 1.20 → strength = 50 + 1.20*25 = 80
+        ("era", 2.50, 80.0),
+        # Inverted: diff = 1.18 - 0.78 = 0.40 → strength = 50 + 0.40*25 = 60
+        ("whip", 0.78, 60.0),
+    ], ids=["hr_full", "sb_full", "saves_full", "era_elite", "whip_elite"])
+    async def test_category_scaling(self, db_session, league_id, stat, value, expected):
         """
-        Pitcher with ERA 2.50 (below target 3.70) → era_strength > 50.
-        Formula: diff = 3.70 - 2.50 = 1.20 → strength = 50 + 1.20*25 = 80.
+        One player with a single stat → that category's strength follows the
+        scaling formula (proportional for counting stats, inverted for ratios).
         """
-        league = await _get_league(db_session)
-        team = await _add_team(db_session, league.id)
-        await _add_player_with_pick(db_session, team.id, era=2.50, ip=100.0)
+        team = await _add_team(db_session, league_id)
+        extra = {"ip": 100.0} if stat in CategoryCalculator.INVERTED_CATEGORIES else {}
+        await _add_player_with_pick(db_session, team.id, **{stat: value}, **extra)
 
         calc = CategoryCalculator()
         strengths = await calc.get_team_strengths(db_session, team.id)
 
-        assert strengths["era"] > 50.0
-        assert strengths["era"] == pytest.approx(80.0)
+        assert strengths[stat] == pytest.approx(expected)
 
-    async def test_rate_stats_weighted_by_pa(self, db_session):
+    async def test_rate_stats_weighted_by_pa(self, db_session, league_id):
         """
         Two batters with different PA counts → AVG is PA-weighted, not a simple mean.
 
@@ -258,10 +378,11 @@ class TestTeamStrengths:
 
         The resulting strength should match the weighted average, not the simple mean.
         """
-        league = await _get_league(db_session)
-        team = await _add_team(db_session, league.id)
-        await _add_player_with_pick(db_session, team.id, src_name="Src1", avg=0.180, pa=100.0)
-        await _add_player_with_pick(db_session, team.id, src_name="Src2", avg=0.280, pa=400.0)
+        team = await _add_team(db_session, league_id)
+        await _add_players_with_picks(db_session, team.id, [
+            {"src_name": "Src1", "avg": 0.180, "pa": 100.0},
+            {"src_name": "Src2", "avg": 0.280, "pa": 400.0},
+        ])
 
         calc = CategoryCalculator()
         strengths = await calc.get_team_strengths(db_session, team.id)
@@ -281,15 +402,15 @@ class TestTeamStrengths:
 # TestTeamNeeds  (DB integration)
 # ===========================================================================
 
+@module_loop
 class TestTeamNeeds:
     """Integration tests for CategoryCalculator.get_team_needs."""
 
-    async def test_needs_sorted_by_strength_ascending(self, db_session):
+    async def test_needs_sorted_by_strength_ascending(self, db_session, league_id):
         """
         Returned needs list is sorted weakest-first (ascending strength values).
         """
-        league = await _get_league(db_session)
-        team = await _add_team(db_session, league.id)
+        team = await _add_team(db_session, league_id)
         # ERA=4.50 → strength ≈ 30 (bad pitcher); strikeouts=500 → strength ≈ 37
         await _add_player_with_pick(
             db_session, team.id,
@@ -306,50 +427,59 @@ class TestTeamNeeds:
             "Needs must be sorted weakest-first"
         )
 
-    async def test_priority_thresholds(self, db_session):
+    async def test_priority_thresholds(self, db_session, league_id):
         """
         strength < 40  → 'high'
         40 ≤ strength < 55  → 'medium'
         55 ≤ strength < 70  → 'low'
 
-        Verified via three teams with precisely-chosen HR projections.
+        Verified via three teams with precisely-chosen HR projections, scored
+        with a single get_team_needs_bulk call.
         """
-        league = await _get_league(db_session)
-
         # Team A: hr=106 → strength = (106/280)*100 ≈ 37.9 → "high"
-        team_a = await _add_team(db_session, league.id, espn_id=101, name="High Team")
+        team_a = await _add_team(db_session, league_id, espn_id=101, name="High Team")
         await _add_player_with_pick(db_session, team_a.id, src_name="SrcA", hr=106.0)
 
         # Team B: hr=140 → strength = (140/280)*100 = 50.0 → "medium"
-        team_b = await _add_team(db_session, league.id, espn_id=102, name="Medium Team")
+        team_b = await _add_team(db_session, league_id, espn_id=102, name="Medium Team")
         await _add_player_with_pick(db_session, team_b.id, src_name="SrcB", hr=140.0)
 
         # Team C: hr=170 → strength = (170/280)*100 ≈ 60.7 → "low"
-        team_c = await _add_team(db_session, league.id, espn_id=103, name="Low Team")
+        team_c = await _add_team(db_session, league_id, espn_id=103, name="Low Team")
         await _add_player_with_pick(db_session, team_c.id, src_name="SrcC", hr=170.0)
 
         calc = CategoryCalculator()
+        needs_by_team = await calc.get_team_needs_bulk(
+            db_session, [team_a.id, team_b.id, team_c.id]
+        )
 
-        needs_a = await calc.get_team_needs(db_session, team_a.id)
-        needs_b = await calc.get_team_needs(db_session, team_b.id)
-        needs_c = await calc.get_team_needs(db_session, team_c.id)
-
-        hr_need_a = next((n for n in needs_a if n["category"] == "hr"), None)
-        hr_need_b = next((n for n in needs_b if n["category"] == "hr"), None)
-        hr_need_c = next((n for n in needs_c if n["category"] == "hr"), None)
+        hr_need_a = next((n for n in needs_by_team[team_a.id] if n["category"] == "hr"), None)
+        hr_need_b = next((n for n in needs_by_team[team_b.id] if n["category"] == "hr"), None)
+        hr_need_c = next((n for n in needs_by_team[team_c.id] if n["category"] == "hr"), None)
 
         assert hr_need_a is not None and hr_need_a["priority"] == "high"
         assert hr_need_b is not None and hr_need_b["priority"] == "medium"
         assert hr_need_c is not None and hr_need_c["priority"] == "low"
 
-    async def test_strong_team_no_needs(self, db_session):
+    async def test_bulk_matches_per_team_needs(self, db_session, league_id):
+        """get_team_needs_bulk returns the same needs as per-team calls, including empty rosters."""
+        team_a = await _add_team(db_session, league_id, espn_id=201, name="Roster Team")
+        await _add_player_with_pick(db_session, team_a.id, era=4.50, ip=100.0, hr=90.0)
+        team_b = await _add_team(db_session, league_id, espn_id=202, name="Empty Team")
+
+        calc = CategoryCalculator()
+        needs_by_team = await calc.get_team_needs_bulk(db_session, [team_a.id, team_b.id])
+
+        assert needs_by_team[team_a.id] == await calc.get_team_needs(db_session, team_a.id)
+        assert needs_by_team[team_b.id] == await calc.get_team_needs(db_session, team_b.id)
+
+    async def test_strong_team_no_needs(self, db_session, league_id):
         """
         All categories at or above strength 70 → needs list is empty.
         Seed a single player with stats at 100 % of every league target plus
         ERA/WHIP well below their targets.
         """
-        league = await _get_league(db_session)
-        team = await _add_team(db_session, league.id)
+        team = await _add_team(db_session, league_id)
         await _add_player_with_pick(
             db_session, team.id,
             # Counting stats at 100 % of targets
@@ -370,15 +500,14 @@ class TestTeamNeeds:
 
         assert needs == [], f"Expected no needs for strong team, got: {needs}"
 
-    async def test_inverted_category_in_needs(self, db_session):
+    async def test_inverted_category_in_needs(self, db_session, league_id):
         """
         ERA above league target (4.50 > 3.70) → ERA appears in needs list with
         strength < 50 and priority 'high'.
 
         Formula: diff = 3.70 - 5.00 = -1.30 → strength = max(0, 50 - 32.5) = 17.5
         """
-        league = await _get_league(db_session)
-        team = await _add_team(db_session, league.id)
+        team = await _add_team(db_session, league_id)
         await _add_player_with_pick(db_session, team.id, era=5.00, ip=100.0)
 
         calc = CategoryCalculator()
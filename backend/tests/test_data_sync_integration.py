@@ -7,36 +7,97 @@ Tests HTML/JSON parsing for:
 - FanGraphs prospect data
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from datetime import datetime
 
+from bs4 import BeautifulSoup
+
 from app.services.data_sync_service import DataSyncService
 
 
+# ---------------------------------------------------------------------------
+# HTML fixtures — parsed once per module; the row parsers only read them.
+# ---------------------------------------------------------------------------
+
+_FP_BASIC_HTML = """
+<tr class="player-row">
+    <td>1</td>
+    <td><a href="/player.php">Mike Trout</a></td>
+    <td>LAA</td>
+    <td>OF</td>
+    <td>1</td>
+    <td>3</td>
+    <td>1.5</td>
+    <td>0.8</td>
+</tr>
+"""
+
+_FP_SHORT_HTML = """
+<tr class="player-row">
+    <td>1</td>
+    <td><a href="/player.php">Mike Trout</a></td>
+</tr>
+"""
+
+_FP_NO_LINK_HTML = """
+<tr class="player-row">
+    <td>5</td>
+    <td>Juan Soto</td>
+    <td>NYY</td>
+    <td>OF</td>
+</tr>
+"""
+
+_FG_HOLLIDAY_HTML = """
+<tr>
+    <td>1</td>
+    <td><a href="/prospect">Jackson Holliday</a></td>
+    <td>BAL</td>
+    <td>SS</td>
+    <td>20</td>
+    <td>AAA</td>
+    <td>60</td>
+    <td>55</td>
+    <td>50</td>
+    <td>50</td>
+    <td>55</td>
+    <td>70</td>
+    <td>2024</td>
+</tr>
+"""
+
+
+def _parse_row(html: str):
+    return BeautifulSoup(html, "html.parser").find("tr")
+
+
+@pytest.fixture(scope="module")
+def fp_basic_row():
+    return _parse_row(_FP_BASIC_HTML)
+
+
+@pytest.fixture(scope="module")
+def fp_short_row():
+    return _parse_row(_FP_SHORT_HTML)
+
+
+@pytest.fixture(scope="module")
+def fp_no_link_row():
+    return _parse_row(_FP_NO_LINK_HTML)
+
+
+@pytest.fixture(scope="module")
+def fg_holliday_row():
+    return _parse_row(_FG_HOLLIDAY_HTML)
+
+
 class TestFantasyProsRankingsParsing:
     """Tests for FantasyPros HTML parsing."""
 
-    def test_parse_fantasypros_row_basic(self):
+    def test_parse_fantasypros_row_basic(self, fp_basic_row):
         """Test parsing a basic FantasyPros player row."""
-        from bs4 import BeautifulSoup
-
-        html = """
-        <tr class="player-row">
-            <td>1</td>
-            <td><a href="/player.php">Mike Trout</a></td>
-            <td>LAA</td>
-            <td>OF</td>
-            <td>1</td>
-            <td>3</td>
-            <td>1.5</td>
-            <td>0.8</td>
-        </tr>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-
         service = DataSyncService()
-        result = service._parse_fantasypros_row(row)
+        result = service._parse_fantasypros_row(fp_basic_row)
 
         assert result is not None
         assert result["name"] == "Mike Trout"
@@ -46,41 +107,17 @@ class TestFantasyProsRankingsParsing:
         assert result["best_rank"] == 1
         assert result["worst_rank"] == 3
 
-    def test_parse_fantasypros_row_missing_cells(self):
+    def test_parse_fantasypros_row_missing_cells(self, fp_short_row):
         """Test parsing row with fewer cells returns None."""
-        from bs4 import BeautifulSoup
-
-        html = """
-        <tr class="player-row">
-            <td>1</td>
-            <td><a href="/player.php">Mike Trout</a></td>
-        </tr>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-
         service = DataSyncService()
-        result = service._parse_fantasypros_row(row)
+        result = service._parse_fantasypros_row(fp_short_row)
 
         assert result is None
 
-    def test_parse_fantasypros_row_no_link(self):
+    def test_parse_fantasypros_row_no_link(self, fp_no_link_row):
         """Test parsing row without anchor tag for name."""
-        from bs4 import BeautifulSoup
-
-        html = """
-        <tr class="player-row">
-            <td>5</td>
-            <td>Juan Soto</td>
-            <td>NYY</td>
-            <td>OF</td>
-        </tr>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-
         service = DataSyncService()
-        result = service._parse_fantasypros_row(row)
+        result = service._parse_fantasypros_row(fp_no_link_row)
 
         assert result is not None
         assert result["name"] == "Juan Soto"
@@ -91,28 +128,25 @@ class TestESPNPlayerDataParsing:
 
     def test_extract_birth_date_from_espn(self):
         """Test extracting birth date from ESPN millisecond timestamp."""
+        from app.utils import birth_date_from_epoch_ms
+
         # ESPN provides dateOfBirth as milliseconds since epoch
-        # Using a more reliable timestamp for testing
         # January 1, 2000 00:00:00 UTC = 946684800000 ms
-        ms_timestamp = 946684800000
-
-        birth_date = datetime.utcfromtimestamp(ms_timestamp / 1000)
+        birth_date = birth_date_from_epoch_ms(946684800000)
 
-        assert birth_date.year == 2000
-        assert birth_date.month == 1
-        assert birth_date.day == 1
+        assert birth_date == datetime(2000, 1, 1)
+        assert birth_date_from_epoch_ms(None) is None
 
     def test_calculate_age_from_birth_date(self):
         """Test age calculation from birth date."""
+        from app.utils import calculate_age_from_birthdate
+
         # Player born August 7, 1991
         birth_date = datetime(1991, 8, 7)
-        today = datetime(2026, 1, 29)  # Current date in test
-
-        age = today.year - birth_date.year
-        if (today.month, today.day) < (birth_date.month, birth_date.day):
-            age -= 1
 
-        assert age == 34  # Birthday hasn't occurred yet in 2026
+        # Birthday hasn't occurred yet in 2026
+        assert calculate_age_from_birthdate(birth_date, today=datetime(2026, 1, 29)) == 34
+        assert calculate_age_from_birthdate(birth_date, today=datetime(2026, 8, 7)) == 35
 
     def test_espn_position_mapping(self):
         """Test ESPN position ID to position name mapping."""
@@ -170,30 +204,26 @@ class TestFanGraphsProspectParsing:
         assert service._parse_grade("") is None
         assert service._parse_grade("   ") is None
 
-    def test_parse_fangraphs_row_with_headers(self):
+    def test_parse_grade_non_numeric(self):
+        """Test parsing non-numeric grade text returns None."""
+        service = DataSyncService()
+
+        assert service._parse_grade("N/A") is None
+        assert service._parse_grade("55.5") is None
+        assert service._parse_grade("+") is None
+
+    def test_parse_grade_whitespace_and_sign(self):
+        """Test grades with inner whitespace or a leading sign still parse."""
+        service = DataSyncService()
+
+        assert service._parse_grade("55 +") == 55
+        assert service._parse_grade("  60+ ") == 60
+        assert service._parse_grade("+55") == 55
+        assert service._parse_grade(True) is None
+
+    def test_parse_fangraphs_row_with_headers(self, fg_holliday_row):
         """Test parsing FanGraphs row using header mapping."""
-        from bs4 import BeautifulSoup
-
-        html = """
-        <tr>
-            <td>1</td>
-            <td><a href="/prospect">Jackson Holliday</a></td>
-            <td>BAL</td>
-            <td>SS</td>
-            <td>20</td>
-            <td>AAA</td>
-            <td>60</td>
-            <td>55</td>
-            <td>50</td>
-            <td>50</td>
-            <td>55</td>
-            <td>70</td>
-            <td>2024</td>
-        </tr>
-        """
-        soup = BeautifulSoup(html, "html.parser")
-        row = soup.find("tr")
-        cells = row.find_all("td")
+        cells = fg_holliday_row.find_all("td")
 
         headers = ["rank", "name", "team", "position", "age", "level",
                    "hit", "power", "speed", "arm", "field", "fv", "eta"]
@@ -267,6 +297,20 @@ class TestCareerStatsParsing:
 
         assert risk >= 60, f"Rookie pitcher should have >=60 risk, got {risk}"
 
+    @pytest.mark.parametrize("pa,expected", [
+        (1100, 10.0),
+        (550, 30.0),
+        (200, 60.0),
+        (0, 90.0),
+    ])
+    def test_experience_risk_from_pa_tier_boundaries(self, pa, expected):
+        """Test each PA tier boundary lands on the edge of its risk band."""
+        from app.services.recommendation_engine import RecommendationEngine
+
+        engine = RecommendationEngine()
+
+        assert engine._experience_risk_from_pa(pa) == pytest.approx(expected)
+
 
 class TestPreviousTeamTracking:
     """Tests for previous_team (offseason team change) tracking."""
@@ -315,86 +359,128 @@ class TestPreviousTeamTracking:
 
     def test_espn_sync_detects_team_change(self):
         """Test that ESPN sync sets previous_team when team changes."""
-        # Create a mock player object simulating pre-sync state
-        player = MagicMock()
-        player.team = "HOU"
-        player.previous_team = None
+        from app.models import Player
 
-        new_team = "CHC"
+        player = Player(name="Kyle Tucker", team="HOU", previous_team=None)
 
-        # Simulate the team change detection logic
-        if player.team and player.team != new_team:
-            player.previous_team = player.team
-        player.team = new_team
+        changed = DataSyncService._apply_team_change(player, "CHC")
 
+        assert changed is True
         assert player.previous_team == "HOU"
         assert player.team == "CHC"
 
     def test_espn_sync_no_change_when_same_team(self):
         """Test that previous_team is not set when team hasn't changed."""
-        player = MagicMock()
-        player.team = "NYY"
-        player.previous_team = None
+        from app.models import Player
 
-        new_team = "NYY"
+        player = Player(name="Aaron Judge", team="NYY", previous_team=None)
 
-        # Simulate the team change detection logic
-        if player.team and player.team != new_team:
-            player.previous_team = player.team
-        player.team = new_team
+        changed = DataSyncService._apply_team_change(player, "NYY")
 
         # previous_team should remain None (not overwritten)
+        assert changed is False
         assert player.previous_team is None
         assert player.team == "NYY"
 
+    def test_espn_sync_first_team_is_not_a_change(self):
+        """Test that a player with no team yet just takes the new team."""
+        from app.models import Player
+
+        player = Player(name="New Signing", team=None, previous_team=None)
+
+        changed = DataSyncService._apply_team_change(player, "SEA")
+
+        assert changed is False
+        assert player.previous_team is None
+        assert player.team == "SEA"
+
+
+class FakeClock:
+    """Monotonic clock stand-in that only moves when a test advances it."""
+
+    def __init__(self, start: float = 100.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
 
 class TestDataSyncServiceRateLimiting:
     """Tests for rate limiting functionality."""
 
+    @staticmethod
+    def _service(clock: FakeClock, **kwargs):
+        sleeper = AsyncMock()
+        service = DataSyncService(time_source=clock, sleeper=sleeper, **kwargs)
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = MagicMock()
+        client = MagicMock()
+        client.get = AsyncMock(return_value=mock_response)
+        service._get_client = AsyncMock(return_value=client)
+        return service, sleeper
+
     @pytest.mark.asyncio
     async def test_rate_limiting_enforced(self):
-        """Test that rate limiting enforces delay between requests."""
-        import time
+        """Test that back-to-back requests wait out the 1 req/sec limit."""
+        clock = FakeClock()
+        service, sleeper = self._service(clock)
 
-        service = DataSyncService()
-        service._last_request_time = time.time()
+        await service._rate_limited_request("GET", "https://example.com")
+        sleeper.assert_not_awaited()
 
-        # The next request should be delayed
-        start = time.time()
+        await service._rate_limited_request("GET", "https://example.com")
+        assert sleeper.await_args_list[-1].args[0] == pytest.approx(1.0)
 
-        # Mock the actual HTTP request
-        with patch.object(service, '_get_client') as mock_client:
-            mock_response = AsyncMock()
-            mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+        # Half a second later the third request is queued behind the second
+        clock.now += 0.5
+        await service._rate_limited_request("GET", "https://example.com")
+        assert sleeper.await_args_list[-1].args[0] == pytest.approx(1.5)
 
-            await service._rate_limited_request("GET", "https://example.com")
+    @pytest.mark.asyncio
+    async def test_no_wait_after_idle_period(self):
+        """Test that a request after the interval has elapsed goes straight through."""
+        clock = FakeClock()
+        service, sleeper = self._service(clock)
+
+        await service._rate_limited_request("GET", "https://example.com")
+        clock.now += 5.0
+        await service._rate_limited_request("GET", "https://example.com")
+
+        sleeper.assert_not_awaited()
 
-        elapsed = time.time() - start
+    @pytest.mark.asyncio
+    async def test_burst_allows_back_to_back_requests(self):
+        """Test that a larger bucket lets a burst through before throttling."""
+        clock = FakeClock()
+        service, sleeper = self._service(clock, burst=3)
+
+        for _ in range(3):
+            await service._rate_limited_request("GET", "https://example.com")
+        sleeper.assert_not_awaited()
 
-        # Should have waited at least 1 second (rate limit), 5% tolerance
-        assert elapsed >= 0.95, "Rate limiting should enforce delay"
+        await service._rate_limited_request("GET", "https://example.com")
+        assert sleeper.await_args_list[-1].args[0] == pytest.approx(1.0)
 
 
 class TestDependencyInjection:
-    """Tests for the dependency injection container."""
+    """Tests for the dependency injection factories."""
 
     def test_service_container_singleton(self):
-        """Test that ServiceContainer returns same instance."""
-        from app.dependencies import ServiceContainer
+        """Test that the dependency factory returns the same instance."""
+        from app.dependencies import get_recommendation_engine
 
-        engine1 = ServiceContainer.get_recommendation_engine()
-        engine2 = ServiceContainer.get_recommendation_engine()
+        engine1 = get_recommendation_engine()
+        engine2 = get_recommendation_engine()
 
         assert engine1 is engine2, "Should return same singleton instance"
 
     def test_service_container_reset(self):
         """Test that reset clears singletons."""
-        from app.dependencies import ServiceContainer
+        from app.dependencies import get_recommendation_engine, reset
 
-        engine1 = ServiceContainer.get_recommendation_engine()
-        ServiceContainer.reset()
-        engine2 = ServiceContainer.get_recommendation_engine()
+        engine1 = get_recommendation_engine()
+        reset()
+        engine2 = get_recommendation_engine()
 
         assert engine1 is not engine2, "Reset should create new instance"
 
@@ -404,14 +490,14 @@ class TestDependencyInjection:
             get_recommendation_engine,
             get_category_calculator,
             get_data_sync_service,
-            ServiceContainer,
+            reset,
         )
         from app.services.recommendation_engine import RecommendationEngine
         from app.services.category_calculator import CategoryCalculator
         from app.services.data_sync_service import DataSyncService
 
         # Reset to ensure clean state
-        ServiceContainer.reset()
+        reset()
 
         rec_engine = get_recommendation_engine()
         cat_calc = get_category_calculator()
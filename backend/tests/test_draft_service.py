@@ -2,21 +2,18 @@
 Real-SQLite integration tests for SessionManager and draft-service helpers.
 
 Replaces the mock-only test_session_persistence.py with tests that actually
-commit to and read from a temporary SQLite database.
+commit to and read from a shared-cache in-memory SQLite database.
 """
 
 import json
-import os
-import tempfile
 from datetime import datetime, timedelta, timezone
 
 import pytest
-from sqlalchemy import create_engine, update
-from sqlalchemy.orm import Session
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import pytest_asyncio
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 import app.models  # noqa: F401 — registers all models with Base
-from app.database import Base
 from app.models import DraftSession, League
 from app.services.draft_service import (
     SessionManager,
@@ -24,59 +21,62 @@ from app.services.draft_service import (
     deserialize_draft_state,
     resolve_session_conflict,
 )
+from conftest import create_schema, make_memory_engine
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
+# CRUD tests share the module-scoped async engine below, so they must run on
+# the same event loop that created it.
+module_loop = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-async def db_session(tmp_path):
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def async_engine():
     """
-    Async session pointing at a fresh temp-file SQLite DB seeded with one League.
-    Function-scoped so each test gets a clean slate.
+    Module-scoped async engine on a shared-cache in-memory DB, seeded with one League.
+
+    The schema comes from the pre-rendered DDL script; the engine's StaticPool
+    connection keeps the DB alive until the module finishes.
     """
-    db_path = str(tmp_path / "test_draft_service.db")
-
-    # ── sync setup (no event loop dependency) ─────────────────────────────
-    sync_engine = create_engine(f"sqlite:///{db_path}")
-    Base.metadata.create_all(sync_engine)
-    with Session(sync_engine) as sess:
-        league = League(espn_league_id=99, name="Test League", year=2026)
-        sess.add(league)
-        sess.commit()
-    sync_engine.dispose()
-
-    # ── async session ──────────────────────────────────────────────────────
-    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
-    AsyncSessionLocal = async_sessionmaker(
-        async_engine, class_=AsyncSession, expire_on_commit=False
-    )
-    async with AsyncSessionLocal() as session:
-        yield session
+    engine = make_memory_engine()
+    await create_schema(engine)
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(League).values(espn_league_id=99, name="Test League", year=2026)
+        )
+    yield engine
+    await engine.dispose()
 
-    await async_engine.dispose()
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def db_session(async_engine):
+    """
+    Async session inside an outer transaction that is rolled back after the test.
+
+    ``session.commit()`` only releases a SAVEPOINT, so each test sees the
+    seeded League and nothing written by earlier tests.
+    """
+    async with async_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+        yield session
+        await session.close()
+        await trans.rollback()
 
 
-@pytest.fixture
-def league_id_sync(tmp_path):
-    """Sync helper: returns the id of the first League in the test DB."""
-    db_path = str(tmp_path / "test_draft_service.db")
-    sync_engine = create_engine(f"sqlite:///{db_path}")
-    with Session(sync_engine) as sess:
-        from sqlalchemy import select
-        result = sess.execute(select(League))
-        lid = result.scalars().first().id
-    sync_engine.dispose()
-    return lid
+# Built once so every lookup hits SQLAlchemy's compiled-statement cache;
+# selects only the id instead of hydrating a League.
+_SELECT_FIRST_LEAGUE_ID = select(League.id).limit(1)
 
 
 # Convenience: get the single league id from an async session
 async def _get_league_id(session: AsyncSession) -> int:
-    from sqlalchemy import select
-    result = await session.execute(select(League))
-    return result.scalars().first().id
+    return (await session.execute(_SELECT_FIRST_LEAGUE_ID)).scalar_one()
 
 
 # ---------------------------------------------------------------------------
@@ -92,6 +92,7 @@ async def _mgr(session: AsyncSession) -> SessionManager:
 # ===========================================================================
 
 
+@module_loop
 class TestSessionCRUD:
     """SessionManager CRUD operations against a real SQLite database."""
 
@@ -200,41 +201,45 @@ class TestSessionCRUD:
 class TestSessionConflictResolution:
     """Tests for the resolve_session_conflict pure function (no DB needed)."""
 
-    def test_merge_local_ui_preferences(self):
-        """Server wins for draft data; local ui_preferences are preserved."""
-        local = {"ui_preferences": {"theme": "dark"}, "current_pick": 2}
-        server = {"current_pick": 5, "picks": [1, 2, 3]}
-
-        result = resolve_session_conflict(local, server)
-
-        assert result["current_pick"] == 5          # server wins
-        assert result["picks"] == [1, 2, 3]          # server data kept
-        assert result["ui_preferences"] == {"theme": "dark"}  # local preserved
-
-    def test_merge_local_settings_only_when_server_lacks_them(self):
-        """Local settings fill in when server has none; server settings win if present."""
-        local = {"settings": {"num_teams": 10}}
-        server_no_settings = {"current_pick": 3}
-        server_with_settings = {"current_pick": 3, "settings": {"num_teams": 12}}
-
-        result_filled = resolve_session_conflict(local, server_no_settings)
-        assert result_filled["settings"] == {"num_teams": 10}
-
-        result_server_wins = resolve_session_conflict(local, server_with_settings)
-        assert result_server_wins["settings"] == {"num_teams": 12}
-
-    def test_null_local_state_handles(self):
-        """None local_state is safe — returns server_state copy."""
-        server = {"current_pick": 5, "picks": [1]}
-        result = resolve_session_conflict(None, server)
-        assert result == server
-
-    def test_null_server_state_returns_local(self):
-        """None server_state returns a copy of local_state."""
-        local = {"current_pick": 2, "picks": [1]}
-        result = resolve_session_conflict(local, None)
-        assert result == local
-
+    @pytest.mark.parametrize(
+        "local,server,expected",
+        [
+            pytest.param(
+                {"ui_preferences": {"theme": "dark"}, "current_pick": 2},
+                {"current_pick": 5, "picks": [1, 2, 3]},
+                # Server wins for draft data; local ui_preferences are preserved
+                {"current_pick": 5, "picks": [1, 2, 3], "ui_preferences": {"theme": "dark"}},
+                id="merge_local_ui_preferences",
+            ),
+            pytest.param(
+                {"settings": {"num_teams": 10}},
+                {"current_pick": 3},
+                # Local settings fill in when the server has none
+                {"current_pick": 3, "settings": {"num_teams": 10}},
+                id="local_settings_fill_gap",
+            ),
+            pytest.param(
+                {"settings": {"num_teams": 10}},
+                {"current_pick": 3, "settings": {"num_teams": 12}},
+                {"current_pick": 3, "settings": {"num_teams": 12}},
+                id="server_settings_win",
+            ),
+            pytest.param(
+                None,
+                {"current_pick": 5, "picks": [1]},
+                {"current_pick": 5, "picks": [1]},
+                id="null_local_state",
+            ),
+            pytest.param(
+                {"current_pick": 2, "picks": [1]},
+                None,
+                {"current_pick": 2, "picks": [1]},
+                id="null_server_state",
+            ),
+        ],
+    )
+    def test_resolve(self, local, server, expected):
+        assert resolve_session_conflict(local, server) == expected
 
 
 # ===========================================================================
@@ -258,12 +263,12 @@ class TestSerialisation:
         assert result == {}
 
     def test_serialize_non_json_types(self):
-        """datetime values are serialised as ISO strings (via default=str)."""
+        """datetime values are serialised via default=str, i.e. str(value)."""
         now = datetime.now(timezone.utc)
         state = {"started_at": now, "round": 1}
         serialized = serialize_draft_state(state)
 
         assert isinstance(serialized, str)
         parsed = json.loads(serialized)
-        assert "started_at" in parsed
-        assert str(now) in parsed or now.isoformat() in parsed or isinstance(parsed["started_at"], str)
+        assert parsed["started_at"] == str(now)
+        assert parsed["round"] == 1
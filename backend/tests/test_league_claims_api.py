@@ -1,33 +1,42 @@
 """
 Integration tests for team-claim endpoints in /api/v1/leagues.
+
+Requests go to the ASGI app through one module-scoped ``httpx.AsyncClient``
+(single pooled connection, no lifespan); each test's writes are rolled back.
 """
 
-import os
-import tempfile
-from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, patch
+import json
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.orm import Session
 
 import app.models  # noqa: F401
-from app.database import Base, get_db
+from app.database import get_db
 from app.main import app
 from app.models import League, Team
+from conftest import RollbackConnection, build_memory_db
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
+BASE = "/api/v1/leagues"
 
-@pytest.fixture
-def client_with_league():
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+JSON_HEADERS = {"content-type": "application/json"}
 
-    sync_engine = create_engine(f"sqlite:///{db_path}")
-    Base.metadata.create_all(sync_engine)
+# POST /teams/manual bodies, encoded once: team count → JSON bytes
+MANUAL_TEAMS_PAYLOADS = {
+    n: json.dumps(
+        {"num_teams": n, "team_names": [f"Team{i}" for i in range(1, n + 1)]}
+    ).encode()
+    for n in (3, 5, 10, 12)
+}
 
-    with Session(sync_engine) as sess:
+
+def _seed(conn):
+    """League with three teams; returns (league_id, team_ids)."""
+    with Session(bind=conn) as sess:
         league = League(espn_league_id=123, name="Claims League", year=2026, num_teams=3)
         sess.add(league)
         sess.flush()
@@ -36,57 +45,87 @@ def client_with_league():
         t2 = Team(league_id=league.id, espn_team_id=2, name="Beta", draft_position=2)
         t3 = Team(league_id=league.id, espn_team_id=3, name="Gamma", draft_position=3)
         sess.add_all([t1, t2, t3])
-        sess.commit()
+        sess.flush()
 
-        league_id = league.id
-        team_ids = {"alpha": t1.id, "beta": t2.id, "gamma": t3.id}
+        return league.id, {"alpha": t1.id, "beta": t2.id, "gamma": t3.id}
 
-    sync_engine.dispose()
 
-    client_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
-    ClientSession = async_sessionmaker(
-        client_engine, expire_on_commit=False, class_=AsyncSession
-    )
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded_db():
+    """Module-scoped shared-cache in-memory DB, schema + league seeded once.
+
+    Yields: (engine, league_id, team_ids)
+    """
+    engine, (league_id, team_ids) = await build_memory_db(_seed)
+    yield engine, league_id, team_ids
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def http_client():
+    """One AsyncClient, capped at a single keep-alive connection, for the module."""
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test", limits=limits
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def client_with_league(seeded_db, http_client):
+    """
+    The module's AsyncClient; whatever the test writes is rolled back after it.
+
+    Yields: (client, league_id, team_ids)
+    """
+    engine, league_id, team_ids = seeded_db
+    rollback_conn = RollbackConnection(engine)
 
     async def override_get_db():
-        async with ClientSession() as session:
+        session = await rollback_conn.session()
+        try:
             yield session
-
-    @asynccontextmanager
-    async def _fake_session_ctx():
-        mock_db = AsyncMock()
-        mock_db.scalar.return_value = 1
-        yield mock_db
+        finally:
+            await session.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    yield http_client, league_id, team_ids
+    app.dependency_overrides.clear()
+    await rollback_conn.rollback()
 
-    with (
-        patch("app.main.init_db", new=AsyncMock()),
-        patch("app.main.async_session", return_value=_fake_session_ctx()),
-    ):
-        with TestClient(app) as c:
-            yield c, league_id, team_ids
 
-    app.dependency_overrides.clear()
-    try:
-        os.unlink(db_path)
-    except OSError:
-        pass
+async def _claim(client, league_id, team_id, user_key):
+    return await client.post(
+        f"{BASE}/{league_id}/claim-team", json={"team_id": team_id, "user_key": user_key}
+    )
 
 
-class TestLeagueClaimEndpoints:
-    BASE = "/api/v1/leagues"
+async def _teams(client, league_id, user_key=None):
+    params = {"user_key": user_key} if user_key else None
+    return await client.get(f"{BASE}/{league_id}/teams", params=params)
+
+
+async def _claim_all_then_list(client, league_id, user_key, *team_ids):
+    """
+    Claim each team in turn for user_key, then list the league's teams.
+
+    Each request depends on the previous write, so they run in order over the
+    client's one keep-alive connection rather than concurrently.
 
-    def test_get_teams_sets_claimed_by_me(self, client_with_league):
+    Returns: ([claim responses], teams response)
+    """
+    claims = [await _claim(client, league_id, team_id, user_key) for team_id in team_ids]
+    return claims, await _teams(client, league_id, user_key)
+
+
+class TestLeagueClaimEndpoints:
+    async def test_get_teams_sets_claimed_by_me(self, client_with_league):
         client, league_id, team_ids = client_with_league
 
-        claim_resp = client.post(
-            f"{self.BASE}/{league_id}/claim-team",
-            json={"team_id": team_ids["alpha"], "user_key": "user_abc123"},
+        (claim_resp,), teams_resp = await _claim_all_then_list(
+            client, league_id, "user_abc123", team_ids["alpha"]
         )
         assert claim_resp.status_code == 200
-
-        teams_resp = client.get(f"{self.BASE}/{league_id}/teams", params={"user_key": "user_abc123"})
         assert teams_resp.status_code == 200
         rows = teams_resp.json()
         mine = [r for r in rows if r["claimed_by_me"]]
@@ -94,23 +133,16 @@ class TestLeagueClaimEndpoints:
         assert mine[0]["id"] == team_ids["alpha"]
         assert mine[0]["claimed_by_user"] == "user_abc123"
 
-    def test_claim_moves_existing_claim_for_same_user(self, client_with_league):
+    async def test_claim_moves_existing_claim_for_same_user(self, client_with_league):
         client, league_id, team_ids = client_with_league
 
-        r1 = client.post(
-            f"{self.BASE}/{league_id}/claim-team",
-            json={"team_id": team_ids["alpha"], "user_key": "user_abc123"},
+        (r1, r2), teams_resp = await _claim_all_then_list(
+            client, league_id, "user_abc123", team_ids["alpha"], team_ids["beta"]
         )
         assert r1.status_code == 200
-
-        r2 = client.post(
-            f"{self.BASE}/{league_id}/claim-team",
-            json={"team_id": team_ids["beta"], "user_key": "user_abc123"},
-        )
         assert r2.status_code == 200
         assert r2.json()["team_id"] == team_ids["beta"]
 
-        teams_resp = client.get(f"{self.BASE}/{league_id}/teams", params={"user_key": "user_abc123"})
         rows = teams_resp.json()
         alpha = next(r for r in rows if r["id"] == team_ids["alpha"])
         beta = next(r for r in rows if r["id"] == team_ids["beta"])
@@ -118,64 +150,56 @@ class TestLeagueClaimEndpoints:
         assert beta["claimed_by_user"] == "user_abc123"
         assert beta["claimed_by_me"] is True
 
-    def test_claim_conflict_returns_409(self, client_with_league):
+    async def test_claim_conflict_returns_409(self, client_with_league):
         client, league_id, team_ids = client_with_league
 
-        first = client.post(
-            f"{self.BASE}/{league_id}/claim-team",
-            json={"team_id": team_ids["gamma"], "user_key": "user_owner"},
-        )
+        first = await _claim(client, league_id, team_ids["gamma"], "user_owner")
         assert first.status_code == 200
 
-        second = client.post(
-            f"{self.BASE}/{league_id}/claim-team",
-            json={"team_id": team_ids["gamma"], "user_key": "user_other"},
-        )
+        second = await _claim(client, league_id, team_ids["gamma"], "user_other")
         assert second.status_code == 409
         assert "already claimed" in second.json()["detail"].lower()
 
-    def test_release_claim(self, client_with_league):
+    async def test_release_claim(self, client_with_league):
         client, league_id, team_ids = client_with_league
 
-        claim_resp = client.post(
-            f"{self.BASE}/{league_id}/claim-team",
-            json={"team_id": team_ids["beta"], "user_key": "user_abc123"},
-        )
+        claim_resp = await _claim(client, league_id, team_ids["beta"], "user_abc123")
         assert claim_resp.status_code == 200
 
-        release_resp = client.delete(
-            f"{self.BASE}/{league_id}/claim-team",
+        release_resp = await client.delete(
+            f"{BASE}/{league_id}/claim-team",
             params={"user_key": "user_abc123"},
         )
         assert release_resp.status_code == 200
         assert release_resp.json()["status"] == "released"
         assert release_resp.json()["team_id"] == team_ids["beta"]
 
-        teams_resp = client.get(f"{self.BASE}/{league_id}/teams", params={"user_key": "user_abc123"})
+        teams_resp = await _teams(client, league_id, "user_abc123")
         rows = teams_resp.json()
         beta = next(r for r in rows if r["id"] == team_ids["beta"])
         assert beta["claimed_by_user"] is None
         assert beta["claimed_by_me"] is False
 
-    def test_manual_teams_upsert_creates_missing_positions(self, client_with_league):
-        client, league_id, _ = client_with_league
+    @pytest.mark.parametrize("num_teams", sorted(MANUAL_TEAMS_PAYLOADS))
+    async def test_manual_teams_upsert_creates_missing_positions(
+        self, client_with_league, num_teams
+    ):
+        client, league_id, team_ids = client_with_league
 
-        resp = client.post(
-            f"{self.BASE}/{league_id}/teams/manual",
-            json={"num_teams": 5, "team_names": ["One", "Two", "Three", "Four", "Five"]},
+        resp = await client.post(
+            f"{BASE}/{league_id}/teams/manual",
+            content=MANUAL_TEAMS_PAYLOADS[num_teams],
+            headers=JSON_HEADERS,
         )
         assert resp.status_code == 200
         data = resp.json()
         assert data["status"] == "ok"
-        assert data["num_teams"] == 5
-        assert data["created"] >= 2
+        assert data["num_teams"] == num_teams
+        # Seeded positions are renamed; the rest are created
+        assert data["updated"] == len(team_ids)
+        assert data["created"] == num_teams - len(team_ids)
 
-        teams_resp = client.get(f"{self.BASE}/{league_id}/teams")
+        teams_resp = await _teams(client, league_id)
         assert teams_resp.status_code == 200
-        teams = teams_resp.json()
-        by_pos = {t["draft_position"]: t["name"] for t in teams}
-        assert by_pos[1] == "One"
-        assert by_pos[2] == "Two"
-        assert by_pos[3] == "Three"
-        assert by_pos[4] == "Four"
-        assert by_pos[5] == "Five"
+        by_pos = {t["draft_position"]: t["name"] for t in teams_resp.json()}
+        assert by_pos == {i: f"Team{i}" for i in range(1, num_teams + 1)}
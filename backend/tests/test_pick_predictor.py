@@ -1,10 +1,13 @@
 """
 Pure-unit tests for PickPredictor and get_player_volatility.
 
-Monte Carlo simulations are seeded for reproducibility.  No DB or async I/O.
+Monte Carlo simulations get a seeded ``np.random.Generator`` for reproducibility.  No DB or async I/O.
 """
 
-import random
+from functools import lru_cache
+
+import numpy as np
+import pytest
 
 from app.services.pick_predictor import PickPredictor, get_player_volatility
 
@@ -13,9 +16,10 @@ from app.services.pick_predictor import PickPredictor, get_player_volatility
 # Helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def _all_players(n=100):
-    """Return a list of (player_id, adp, volatility) for n players."""
-    return [(i, float(i), 2.0) for i in range(1, n + 1)]
+    """Return a tuple of (player_id, adp, volatility) for n players, built once per n."""
+    return tuple((i, float(i), 2.0) for i in range(1, n + 1))
 
 
 # ===========================================================================
@@ -146,6 +150,7 @@ class TestPredictAvailabilityEdgeCases:
         )
         assert result.probability == 0.0
         assert result.expected_draft_position == 10.0
+        assert result.simulations_run == 0
 
     def test_picks_between_zero(self):
         """target_pick == current_pick → picks_between=0 → returns 1.0 immediately."""
@@ -177,7 +182,6 @@ class TestPredictAvailabilitySimulation:
 
     def test_high_probability_scenario(self):
         """Player with ADP=50 at target=pick 10 — almost certainly still available."""
-        random.seed(42)
         result = self.predictor.predict_availability(
             player_id=50,
             player_name="Late Pick",
@@ -188,12 +192,12 @@ class TestPredictAvailabilitySimulation:
             num_teams=10,
             already_drafted_ids=set(),
             all_players_adp=self.all_players,
+            rng=np.random.default_rng(42),
         )
         assert result.probability >= 0.80, f"Expected >= 0.80, got {result.probability:.3f}"
 
     def test_low_probability_scenario(self):
         """Player with ADP=5 at target=pick 10 — almost certainly gone by then."""
-        random.seed(42)
         result = self.predictor.predict_availability(
             player_id=5,
             player_name="Early Pick",
@@ -204,59 +208,42 @@ class TestPredictAvailabilitySimulation:
             num_teams=10,
             already_drafted_ids=set(),
             all_players_adp=self.all_players,
+            rng=np.random.default_rng(42),
         )
         assert result.probability <= 0.20, f"Expected <= 0.20, got {result.probability:.3f}"
 
-    def test_verdict_classification(self):
+    @pytest.mark.parametrize(
+        "player_id, adp, expected",
+        [(50, 50.0, "Likely Available"), (5, 5.0, "Unlikely")],
+        ids=["late", "early"],
+    )
+    def test_verdict_classification(self, player_id, adp, expected):
         """probability→verdict thresholds: >=0.7 Likely Available, >=0.3 Risky, else Unlikely."""
-        # Likely Available
-        random.seed(42)
-        r_high = self.predictor.predict_availability(
-            50, "Late", 50.0, 2.0, 1, 10, 10, set(), self.all_players
-        )
-        assert r_high.verdict == "Likely Available", (
-            f"Expected 'Likely Available', got '{r_high.verdict}' (p={r_high.probability:.2f})"
-        )
-
-        # Unlikely
-        random.seed(42)
-        r_low = self.predictor.predict_availability(
-            5, "Early", 5.0, 2.0, 1, 10, 10, set(), self.all_players
+        r = self.predictor.predict_availability(
+            player_id, "P", adp, 2.0, 1, 10, 10, set(), self.all_players,
+            rng=np.random.default_rng(42),
         )
-        assert r_low.verdict == "Unlikely", (
-            f"Expected 'Unlikely', got '{r_low.verdict}' (p={r_low.probability:.2f})"
+        assert r.verdict == expected, (
+            f"Expected '{expected}', got '{r.verdict}' (p={r.probability:.2f})"
         )
 
         # Verify the verdict exactly matches the probability thresholds
-        for r in (r_high, r_low):
-            if r.probability >= 0.7:
-                assert r.verdict == "Likely Available"
-            elif r.probability >= 0.3:
-                assert r.verdict == "Risky"
-            else:
-                assert r.verdict == "Unlikely"
-
-    def test_confidence_classification(self):
+        if r.probability >= 0.7:
+            assert r.verdict == "Likely Available"
+        elif r.probability >= 0.3:
+            assert r.verdict == "Risky"
+        else:
+            assert r.verdict == "Unlikely"
+
+    @pytest.mark.parametrize(
+        "vol, expected", [(3.0, "High"), (10.0, "Medium"), (20.0, "Low")]
+    )
+    def test_confidence_classification(self, vol, expected):
         """volatility→confidence: <=5 High, <=15 Medium, >15 Low."""
-        all_p = _all_players(100)
-
-        # High confidence: low volatility
-        r_high = self.predictor.predict_availability(
-            50, "P", 50.0, 3.0, 1, 10, 10, set(), all_p
-        )
-        assert r_high.confidence == "High", f"Expected High, got {r_high.confidence}"
-
-        # Medium confidence
-        r_med = self.predictor.predict_availability(
-            50, "P", 50.0, 10.0, 1, 10, 10, set(), all_p
-        )
-        assert r_med.confidence == "Medium", f"Expected Medium, got {r_med.confidence}"
-
-        # Low confidence: high volatility
-        r_low = self.predictor.predict_availability(
-            50, "P", 50.0, 20.0, 1, 10, 10, set(), all_p
+        r = self.predictor.predict_availability(
+            50, "P", 50.0, vol, 1, 10, 10, set(), self.all_players
         )
-        assert r_low.confidence == "Low", f"Expected Low, got {r_low.confidence}"
+        assert r.confidence == expected, f"Expected {expected}, got {r.confidence}"
 
     def test_confidence_degrades_for_long_waits(self):
         """Long waits in turn-distance reduce confidence even for low-volatility players."""
@@ -308,7 +295,6 @@ class TestProbabilityFormatting:
 
     def test_formats_decimal(self):
         """Simulation probability is formatted with a '%' suffix."""
-        random.seed(42)
         result = self.predictor.predict_availability(
             player_id=50,
             player_name="Mid",
@@ -319,15 +305,10 @@ class TestProbabilityFormatting:
             num_teams=10,
             already_drafted_ids=set(),
             all_players_adp=_all_players(100),
+            rng=np.random.default_rng(42),
         )
         assert result.probability_pct.endswith("%")
         # Should be parseable as a number
         raw = result.probability_pct.lstrip("<").rstrip("%")
         float(raw)  # should not raise
 
-
-# ---------------------------------------------------------------------------
-# Make pytest.approx available (imported at top as needed)
-# ---------------------------------------------------------------------------
-
-import pytest
@@ -8,45 +8,73 @@ Tests cover:
 - Pick recommendation methods
 """
 import pytest
-from unittest.mock import patch
 
-from app.services.recommendation_engine import RecommendationEngine
 from app.config import settings
-from conftest import MockPlayerRanking, MockPlayerProjection
+from conftest import MockPlayerRanking, MockPlayerProjection, MockPlayerNews, assert_unique
+
+
+def _ranked_player(mock_player_factory, *, overall_rank, projection, **kwargs):
+    """Player with a single ranking (ADP equal to its rank) and one projection."""
+    return mock_player_factory(
+        rankings=[MockPlayerRanking(overall_rank=overall_rank, adp=float(overall_rank))],
+        projections=[MockPlayerProjection(**projection)],
+        **kwargs,
+    )
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_risk_cache(
+    engine,
+    player_with_consistent_rankings,
+    player_injured_il60,
+    player_rookie,
+    player_with_high_variance,
+    young_hitter_at_peak,
+    true_rookie_high_risk,
+):
+    """Score the players most tests share once, up front, into the engine's risk cache."""
+    for player in (
+        player_with_consistent_rankings,
+        player_injured_il60,
+        player_rookie,
+        player_with_high_variance,
+        young_hitter_at_peak,
+        true_rookie_high_risk,
+    ):
+        engine.calculate_risk_score(player)
+
+
+@pytest.fixture(scope="module")
+def uncached_consistent_score(engine, player_with_consistent_rankings):
+    """Risk score for player_with_consistent_rankings computed with the cache bypassed."""
+    return engine.calculate_risk_score(player_with_consistent_rankings, use_cache=False).score
+
+
+class TestDefaultScores:
+    """Risk factors fall back to a moderate 50 when the data can't support a score."""
+
+    @pytest.mark.parametrize("method,fixture_name", [
+        ("_calculate_rank_variance", "player_no_data"),
+        ("_calculate_rank_variance", "player_single_ranking"),
+        ("_calculate_projection_variance", "player_with_consistent_rankings"),
+        ("_calculate_adp_ecr_risk", "player_no_data"),
+    ])
+    def test_returns_default(self, engine, request, method, fixture_name):
+        player = request.getfixturevalue(fixture_name)
+        assert getattr(engine, method)(player) == 50
 
 
 class TestRankVariance:
     """Tests for _calculate_rank_variance method."""
 
-    def test_no_rankings_returns_default(self, player_no_data):
-        """No rankings should return default moderate score."""
-        engine = RecommendationEngine()
-        score = engine._calculate_rank_variance(player_no_data)
-        assert score == 50
-
-    def test_single_ranking_returns_default(self, mock_player_factory):
-        """Single ranking can't calculate variance, returns default."""
-        player = mock_player_factory(
-            rankings=[{"overall_rank": 10}],
-        )
-        # Need to use proper mock structure
-        from tests.conftest import MockPlayerRanking
-        player.rankings = [MockPlayerRanking(overall_rank=10)]
-
-        engine = RecommendationEngine()
-        score = engine._calculate_rank_variance(player)
-        assert score == 50
-
-    def test_consistent_rankings_low_variance(self, player_with_consistent_rankings):
+    def test_consistent_rankings_low_variance(self, engine, player_with_consistent_rankings):
         """Consistent rankings should yield low variance score."""
-        engine = RecommendationEngine()
         score = engine._calculate_rank_variance(player_with_consistent_rankings)
         # Rankings: 9, 10, 11 - very low std dev
         assert score <= 30
 
-    def test_high_variance_rankings(self, player_with_high_variance):
+    def test_high_variance_rankings(self, engine, player_with_high_variance):
         """Widely varying rankings should yield high variance score."""
-        engine = RecommendationEngine()
         score = engine._calculate_rank_variance(player_with_high_variance)
         # Rankings: 20, 50, 80 - high std dev
         assert score > 50
@@ -55,35 +83,25 @@ class TestRankVariance:
 class TestInjuryRisk:
     """Tests for _calculate_injury_risk method."""
 
-    def test_healthy_player_no_news(self, player_with_consistent_rankings):
+    def test_healthy_player_no_news(self, engine, player_with_consistent_rankings):
         """Healthy player with no injury news should have low risk."""
-        engine = RecommendationEngine()
         score = engine._calculate_injury_risk(player_with_consistent_rankings)
         assert score == 0
 
-    def test_il60_injury_high_score(self, player_injured_il60):
-        """IL-60 injury should give high injury score."""
-        engine = RecommendationEngine()
-        score = engine._calculate_injury_risk(player_injured_il60)
-        assert score >= settings.injury_score_il60
-
-    def test_il10_injury_moderate_score(self, player_injured_il10):
-        """IL-10 injury should give moderate injury score."""
-        engine = RecommendationEngine()
-        score = engine._calculate_injury_risk(player_injured_il10)
-        assert score >= settings.injury_score_il10
-        assert score < settings.injury_score_il60
-
-    def test_dtd_injury_low_score(self, player_injured_dtd):
-        """DTD status should give lower injury score than IL."""
-        engine = RecommendationEngine()
-        score = engine._calculate_injury_risk(player_injured_dtd)
-        assert score >= settings.injury_score_dtd
-        assert score < settings.injury_score_il10
-
-    def test_injury_news_adds_penalty(self, player_with_injury_news):
+    @pytest.mark.parametrize("fixture_name,min_attr,max_attr", [
+        ("player_injured_il60", "injury_score_il60", None),
+        ("player_injured_il10", "injury_score_il10", "injury_score_il60"),
+        ("player_injured_dtd", "injury_score_dtd", "injury_score_il10"),
+    ])
+    def test_injury_tier(self, engine, request, fixture_name, min_attr, max_attr):
+        """Each injury status scores at least its own tier and below the next one up."""
+        score = engine._calculate_injury_risk(request.getfixturevalue(fixture_name))
+        assert score >= getattr(settings, min_attr)
+        if max_attr:
+            assert score < getattr(settings, max_attr)
+
+    def test_injury_news_adds_penalty(self, engine, player_with_injury_news):
         """Injury-related news items should add to score."""
-        engine = RecommendationEngine()
         score = engine._calculate_injury_risk(player_with_injury_news)
         # 3 injury news items * 5 = 15 penalty
         expected_penalty = min(
@@ -92,18 +110,15 @@ class TestInjuryRisk:
         )
         assert score == expected_penalty
 
-    def test_injury_score_capped_at_100(self, mock_player_factory):
+    def test_injury_score_capped_at_100(self, engine, mock_player_factory, ten_injury_news):
         """Injury score should never exceed 100."""
-        from tests.conftest import MockPlayerNews
-
         # Create player with IL-60 + many injury news items
         player = mock_player_factory(
             is_injured=True,
             injury_status="IL-60",
-            news_items=[MockPlayerNews(is_injury_related=True) for _ in range(10)],
+            news_items=list(ten_injury_news),
         )
 
-        engine = RecommendationEngine()
         score = engine._calculate_injury_risk(player)
         assert score <= 100
 
@@ -116,38 +131,33 @@ class TestExperienceRisk:
     fallback behavior.
     """
 
-    def test_no_projections_high_risk(self, player_no_data):
+    def test_no_projections_high_risk(self, engine, player_no_data):
         """No projections and no career stats means high risk."""
-        engine = RecommendationEngine()
         score = engine._calculate_experience_risk(player_no_data)
         # No career stats AND no projections = 70 risk
         assert score == 70
 
-    def test_projection_fallback_adds_penalty(self, player_veteran_hitter):
+    def test_projection_fallback_adds_penalty(self, engine, player_veteran_hitter):
         """Veteran without career_pa falls back to projections with +20 penalty."""
-        engine = RecommendationEngine()
         score = engine._calculate_experience_risk(player_veteran_hitter)
         # No career_pa set, so uses projected PA with +20 penalty
         # Even with good projections, penalty pushes score up
         assert score < 60  # Still reasonable due to good projections
 
-    def test_pitcher_projection_fallback(self, player_starting_pitcher):
+    def test_pitcher_projection_fallback(self, engine, player_starting_pitcher):
         """Pitcher without career_ip falls back to projections with +20 penalty."""
-        engine = RecommendationEngine()
         score = engine._calculate_experience_risk(player_starting_pitcher)
         # No career_ip set, uses projected IP with +20 penalty
         assert score < 60  # Still reasonable due to good projections
 
-    def test_rookie_high_risk(self, player_rookie):
+    def test_rookie_high_risk(self, engine, player_rookie):
         """Rookie with limited projections should be high risk."""
-        engine = RecommendationEngine()
         score = engine._calculate_experience_risk(player_rookie)
         # Low projected PA + 20 penalty
         assert score > 50
 
-    def test_relief_pitcher_projection_fallback(self, player_relief_pitcher):
+    def test_relief_pitcher_projection_fallback(self, engine, player_relief_pitcher):
         """Relief pitcher without career_ip uses projections with penalty."""
-        engine = RecommendationEngine()
         score = engine._calculate_experience_risk(player_relief_pitcher)
         # 65 IP projection + 20 penalty = elevated risk
         assert score > 50  # Higher than before due to penalty
@@ -156,22 +166,14 @@ class TestExperienceRisk:
 class TestProjectionVariance:
     """Tests for _calculate_projection_variance method."""
 
-    def test_single_projection_returns_default(self, player_with_consistent_rankings):
-        """Single projection can't calculate variance."""
-        engine = RecommendationEngine()
-        score = engine._calculate_projection_variance(player_with_consistent_rankings)
-        assert score == 50
-
-    def test_consistent_projections_low_variance(self, player_veteran_hitter):
+    def test_consistent_projections_low_variance(self, engine, player_veteran_hitter):
         """Similar projections across systems = low variance."""
-        engine = RecommendationEngine()
         score = engine._calculate_projection_variance(player_veteran_hitter)
         # HR: 35, 32 - fairly consistent
         assert score < 50
 
-    def test_divergent_projections_high_variance(self, player_with_high_variance):
+    def test_divergent_projections_high_variance(self, engine, player_with_high_variance):
         """Widely different projections = high variance."""
-        engine = RecommendationEngine()
         score = engine._calculate_projection_variance(player_with_high_variance)
         # HR: 25, 35 and SB: 15, 20 - significant spread
         assert score > 20
@@ -180,21 +182,18 @@ class TestProjectionVariance:
 class TestAgeRisk:
     """Tests for _calculate_age_risk method."""
 
-    def test_pitcher_higher_age_risk(self, player_starting_pitcher):
+    def test_pitcher_higher_age_risk(self, engine, player_starting_pitcher):
         """Pitchers should have higher age risk than position players."""
-        engine = RecommendationEngine()
         score = engine._calculate_age_risk(player_starting_pitcher)
         assert score == settings.age_risk_pitcher
 
-    def test_relief_pitcher_higher_age_risk(self, player_relief_pitcher):
+    def test_relief_pitcher_higher_age_risk(self, engine, player_relief_pitcher):
         """Relief pitchers also have higher age risk."""
-        engine = RecommendationEngine()
         score = engine._calculate_age_risk(player_relief_pitcher)
         assert score == settings.age_risk_pitcher
 
-    def test_position_player_lower_age_risk(self, player_veteran_hitter):
+    def test_position_player_lower_age_risk(self, engine, player_veteran_hitter):
         """Position players have lower age risk."""
-        engine = RecommendationEngine()
         score = engine._calculate_age_risk(player_veteran_hitter)
         assert score == settings.age_risk_hitter
 
@@ -202,22 +201,14 @@ class TestAgeRisk:
 class TestAdpEcrRisk:
     """Tests for _calculate_adp_ecr_risk method."""
 
-    def test_no_rankings_returns_default(self, player_no_data):
-        """No rankings means default score."""
-        engine = RecommendationEngine()
-        score = engine._calculate_adp_ecr_risk(player_no_data)
-        assert score == 50
-
-    def test_matching_adp_ecr_low_risk(self, player_with_consistent_rankings):
+    def test_matching_adp_ecr_low_risk(self, engine, player_with_consistent_rankings):
         """When ADP matches ECR, risk is low."""
-        engine = RecommendationEngine()
         score = engine._calculate_adp_ecr_risk(player_with_consistent_rankings)
         # ADP ~10, consensus_rank 10 - minimal difference
         assert score < 10
 
-    def test_large_adp_ecr_gap_high_risk(self, player_adp_ecr_mismatch):
+    def test_large_adp_ecr_gap_high_risk(self, engine, player_adp_ecr_mismatch):
         """Large gap between ADP and ECR = high uncertainty."""
-        engine = RecommendationEngine()
         score = engine._calculate_adp_ecr_risk(player_adp_ecr_mismatch)
         # ADP 60, ECR 30 - difference of 30 * 3 = 90
         assert score >= 80
@@ -226,37 +217,27 @@ class TestAdpEcrRisk:
 class TestCalculateRiskScore:
     """Tests for the main calculate_risk_score method."""
 
-    def test_safe_player_classification(self, player_with_consistent_rankings):
-        """Low-risk player should be classified as safe."""
-        engine = RecommendationEngine()
-        assessment = engine.calculate_risk_score(player_with_consistent_rankings)
-        assert assessment.classification == "safe"
-        assert assessment.score < settings.safe_risk_threshold
-
-    def test_risky_player_classification(self, player_injured_il60):
-        """High-risk player should be classified as risky."""
-        engine = RecommendationEngine()
-        assessment = engine.calculate_risk_score(player_injured_il60)
+    @pytest.mark.parametrize("fixture_name,expected", [
+        ("player_with_consistent_rankings", {"safe"}),
         # IL-60 injury alone should push into risky territory
-        assert assessment.classification in ["moderate", "risky"]
-        assert assessment.score >= settings.safe_risk_threshold
-
-    def test_moderate_player_classification(self, player_rookie):
-        """Medium-risk player should be classified as moderate."""
-        engine = RecommendationEngine()
-        assessment = engine.calculate_risk_score(player_rookie)
+        ("player_injured_il60", {"moderate", "risky"}),
         # Rookie has experience risk but may not be fully risky
-        assert assessment.classification in ["moderate", "safe"]
-
-    def test_risk_factors_populated_for_risky(self, player_injured_il60):
+        ("player_rookie", {"moderate", "safe"}),
+    ])
+    def test_classification(self, engine, request, fixture_name, expected):
+        """Players should be classified by their score against the safe threshold."""
+        assessment = engine.calculate_risk_score(request.getfixturevalue(fixture_name))
+        assert assessment.classification in expected
+        is_safe = assessment.score < settings.safe_risk_threshold
+        assert is_safe == (assessment.classification == "safe")
+
+    def test_risk_factors_populated_for_risky(self, engine, player_injured_il60):
         """Risky players should have risk factors listed."""
-        engine = RecommendationEngine()
         assessment = engine.calculate_risk_score(player_injured_il60)
         assert len(assessment.factors) > 0
 
-    def test_upside_identified_for_risky(self, player_with_high_variance):
+    def test_upside_identified_for_risky(self, engine, player_with_high_variance):
         """Risky players should have upside identified."""
-        engine = RecommendationEngine()
         assessment = engine.calculate_risk_score(player_with_high_variance)
         # Player with high variance should not be classified as safe
         assert assessment.classification in ["moderate", "risky"], \
@@ -271,16 +252,12 @@ class TestCalculateRiskScore:
 class TestRiskWeights:
     """Tests for risk weight configuration."""
 
-    def test_weights_sum_to_one(self):
+    def test_weights_sum_to_one(self, engine):
         """Risk weights should sum to 1.0."""
-        engine = RecommendationEngine()
-        weights = engine.risk_weights
-        total = sum(weights.values())
-        assert abs(total - 1.0) < 0.001  # Allow small floating point error
+        assert sum(engine.risk_weights.values()) == pytest.approx(1.0, abs=1e-3)
 
-    def test_weights_from_config(self):
+    def test_weights_from_config(self, engine):
         """Weights should come from config settings."""
-        engine = RecommendationEngine()
         weights = engine.risk_weights
         assert weights["rank_variance"] == settings.risk_weight_rank_variance
         assert weights["injury_history"] == settings.risk_weight_injury
@@ -290,9 +267,8 @@ class TestRiskWeights:
 class TestGetSafePicks:
     """Tests for get_safe_picks method."""
 
-    def test_returns_only_safe_players(self, player_with_consistent_rankings, player_injured_il60):
+    def test_returns_only_safe_players(self, engine, player_with_consistent_rankings, player_injured_il60):
         """Should only return players classified as safe."""
-        engine = RecommendationEngine()
         players = [player_with_consistent_rankings, player_injured_il60]
         safe_picks = engine.get_safe_picks(players)
 
@@ -305,30 +281,26 @@ class TestGetSafePicks:
         assert safe_picks[0].player.name == "Consistent Star", \
             f"Expected 'Consistent Star', got '{safe_picks[0].player.name}'"
 
-    def test_respects_limit(self, mock_player_factory):
+    def test_respects_limit(self, engine, ten_safe_players):
         """Should respect the limit parameter."""
-        from tests.conftest import MockPlayerRanking, MockPlayerProjection
-
-        players = []
-        for i in range(10):
-            player = mock_player_factory(
-                name=f"Safe Player {i}",
-                consensus_rank=i + 1,
-                rankings=[
-                    MockPlayerRanking(overall_rank=i + 1),
-                    MockPlayerRanking(overall_rank=i + 2),
-                ],
-                projections=[MockPlayerProjection(pa=600)],
-            )
-            players.append(player)
-
-        engine = RecommendationEngine()
-        safe_picks = engine.get_safe_picks(players, limit=3)
+        safe_picks = engine.get_safe_picks(ten_safe_players, limit=3)
         assert len(safe_picks) <= 3
 
-    def test_empty_list_returns_empty(self):
+    def test_matches_ranked_scalar_classification(
+        self, engine, ten_safe_players, player_injured_il60, player_with_high_variance
+    ):
+        """Should return the best-ranked safe players, as scoring each one would."""
+        players = [player_injured_il60, *reversed(ten_safe_players), player_with_high_variance]
+        expected = [
+            p.name for p in sorted(players, key=lambda p: p.consensus_rank or 999)
+            if engine.calculate_risk_score(p).classification == "safe"
+        ][:3]
+
+        safe_picks = engine.get_safe_picks(players, limit=3)
+        assert [pick.player.name for pick in safe_picks] == expected
+
+    def test_empty_list_returns_empty(self, engine):
         """Empty player list should return empty results."""
-        engine = RecommendationEngine()
         safe_picks = engine.get_safe_picks([])
         assert safe_picks == []
 
@@ -336,9 +308,8 @@ class TestGetSafePicks:
 class TestGetRiskyPicks:
     """Tests for get_risky_picks method."""
 
-    def test_excludes_safe_players(self, player_with_consistent_rankings, player_injured_il60):
+    def test_excludes_safe_players(self, engine, player_with_consistent_rankings, player_injured_il60):
         """Should exclude players classified as safe."""
-        engine = RecommendationEngine()
         players = [player_with_consistent_rankings, player_injured_il60]
         risky_picks = engine.get_risky_picks(players)
 
@@ -346,9 +317,8 @@ class TestGetRiskyPicks:
         for pick in risky_picks:
             assert pick.player.name != "Consistent Star"
 
-    def test_includes_risk_factors(self, player_injured_il60):
+    def test_includes_risk_factors(self, engine, player_injured_il60):
         """Risky picks should include risk factors."""
-        engine = RecommendationEngine()
         risky_picks = engine.get_risky_picks([player_injured_il60])
 
         # IL-60 injured player should be classified as risky/moderate (not safe)
@@ -361,26 +331,24 @@ class TestGetRiskyPicks:
 class TestGetCategorySpecialists:
     """Tests for get_category_specialists method."""
 
-    def test_identifies_speed_specialist(self, speed_specialist):
+    def test_identifies_speed_specialist(self, engine, speed_specialist):
         """Should identify players with elite SB potential."""
-        engine = RecommendationEngine()
         specialists = engine.get_category_specialists([speed_specialist])
 
-        assert len(specialists) > 0
-        assert any("SB" in s.rationale or "Speed" in s.rationale for s in specialists)
+        assert specialists
+        rationales = " ".join(s.rationale for s in specialists)
+        assert "SB" in rationales or "Speed" in rationales
 
-    def test_identifies_power_specialist(self, power_specialist):
+    def test_identifies_power_specialist(self, engine, power_specialist):
         """Should identify players with elite HR potential."""
-        engine = RecommendationEngine()
         specialists = engine.get_category_specialists([power_specialist])
 
-        assert len(specialists) > 0
-        assert any("HR" in s.rationale or "Power" in s.rationale for s in specialists)
+        assert specialists
+        rationales = " ".join(s.rationale for s in specialists)
+        assert "HR" in rationales or "Power" in rationales
 
-    def test_deduplicates_players(self, mock_player_factory):
+    def test_deduplicates_players(self, engine, mock_player_factory):
         """Same player should not appear multiple times."""
-        from tests.conftest import MockPlayerRanking, MockPlayerProjection
-
         # Player who qualifies for multiple categories
         multi_threat = mock_player_factory(
             name="5-Tool Player",
@@ -388,34 +356,28 @@ class TestGetCategorySpecialists:
             rankings=[MockPlayerRanking(overall_rank=5)],
         )
 
-        engine = RecommendationEngine()
         specialists = engine.get_category_specialists([multi_threat])
 
-        # Check for duplicates
-        names = [s.player.name for s in specialists]
-        assert len(names) == len(set(names))
+        assert_unique(s.player.name for s in specialists)
 
 
 class TestIdentifyUpside:
     """Tests for _identify_upside method."""
 
-    def test_identifies_hr_upside(self, power_specialist):
+    def test_identifies_hr_upside(self, engine, power_specialist):
         """Should identify elite HR upside."""
-        engine = RecommendationEngine()
         assessment = engine.calculate_risk_score(power_specialist)
         # Manually call _identify_upside with fake scores to test
         upside = engine._identify_upside(power_specialist, {"rank_variance": 60})
         assert "HR" in upside
 
-    def test_identifies_sb_upside(self, speed_specialist):
+    def test_identifies_sb_upside(self, engine, speed_specialist):
         """Should identify elite SB upside."""
-        engine = RecommendationEngine()
         upside = engine._identify_upside(speed_specialist, {"rank_variance": 60})
         assert "SB" in upside
 
-    def test_default_upside_message(self, player_no_data):
+    def test_default_upside_message(self, engine, player_no_data):
         """Players without clear upside should get default message."""
-        engine = RecommendationEngine()
         upside = engine._identify_upside(player_no_data, {})
         assert "ceiling" in upside.lower() or upside != ""
 
@@ -426,33 +388,22 @@ class TestIdentifyUpside:
 class TestAgeRiskWithActualAges:
     """Tests for the improved age risk calculation using actual player ages."""
 
-    def test_peak_age_hitter_low_risk(self, young_hitter_at_peak):
-        """27-year-old hitter should have low age risk."""
-        engine = RecommendationEngine()
-        score = engine._calculate_age_risk(young_hitter_at_peak)
-        assert score <= 15, f"Peak age hitter (27) should have low risk, got {score}"
-
-    def test_declining_hitter_high_risk(self, aging_hitter_declining):
-        """36-year-old hitter should have high age risk."""
-        engine = RecommendationEngine()
-        score = engine._calculate_age_risk(aging_hitter_declining)
-        assert score >= 60, f"36-year-old hitter should have high risk, got {score}"
-
-    def test_young_pitcher_low_risk(self, young_pitcher_pre_peak):
-        """24-year-old pitcher before peak should have low risk."""
-        engine = RecommendationEngine()
-        score = engine._calculate_age_risk(young_pitcher_pre_peak)
-        assert score <= 20, f"24-year-old pitcher should have low risk, got {score}"
-
-    def test_aging_pitcher_high_risk(self, aging_pitcher_high_risk):
-        """34-year-old pitcher should have higher age risk."""
-        engine = RecommendationEngine()
-        score = engine._calculate_age_risk(aging_pitcher_high_risk)
-        assert score >= 50, f"34-year-old pitcher should have elevated risk, got {score}"
-
-    def test_older_hitter_vs_older_pitcher(self, aging_hitter_declining, aging_pitcher_high_risk):
+    @pytest.mark.parametrize("fixture_name,low,high", [
+        ("young_hitter_at_peak", None, 15),      # 27-year-old hitter
+        ("aging_hitter_declining", 60, None),    # 36-year-old hitter
+        ("young_pitcher_pre_peak", None, 20),    # 24-year-old pitcher
+        ("aging_pitcher_high_risk", 50, None),   # 34-year-old pitcher
+    ])
+    def test_age_risk_bounds(self, engine, request, fixture_name, low, high):
+        """Age risk should stay low around the peak and climb past it."""
+        score = engine._calculate_age_risk(request.getfixturevalue(fixture_name))
+        if low is not None:
+            assert score >= low, f"{fixture_name} should have risk >= {low}, got {score}"
+        if high is not None:
+            assert score <= high, f"{fixture_name} should have risk <= {high}, got {score}"
+
+    def test_older_hitter_vs_older_pitcher(self, engine, aging_hitter_declining, aging_pitcher_high_risk):
         """Older pitcher should have higher risk than older hitter of similar age."""
-        engine = RecommendationEngine()
         hitter_risk = engine._calculate_age_risk(aging_hitter_declining)
         pitcher_risk = engine._calculate_age_risk(aging_pitcher_high_risk)
         # Note: hitter is 36, pitcher is 34, so pitcher might be lower
@@ -464,33 +415,22 @@ class TestAgeRiskWithActualAges:
 class TestExperienceRiskWithCareerStats:
     """Tests for experience risk using career stats instead of projections."""
 
-    def test_proven_veteran_zero_risk(self, proven_veteran_low_risk):
-        """Player with 2500+ career PA should have very low experience risk."""
-        engine = RecommendationEngine()
-        score = engine._calculate_experience_risk(proven_veteran_low_risk)
-        assert score <= 10, f"Proven veteran should have minimal risk, got {score}"
-
-    def test_established_player_low_risk(self, established_player_medium_risk):
-        """Player with 650 career PA should have low-moderate risk."""
-        engine = RecommendationEngine()
-        score = engine._calculate_experience_risk(established_player_medium_risk)
-        assert 10 <= score <= 30, f"Established player should have 10-30 risk, got {score}"
-
-    def test_limited_experience_moderate_risk(self, limited_experience_player):
-        """Player with 300 career PA should have moderate risk."""
-        engine = RecommendationEngine()
-        score = engine._calculate_experience_risk(limited_experience_player)
-        assert 30 <= score <= 60, f"Limited experience should have 30-60 risk, got {score}"
-
-    def test_true_rookie_high_risk(self, true_rookie_high_risk):
-        """Rookie with 50 career PA should have high risk."""
-        engine = RecommendationEngine()
-        score = engine._calculate_experience_risk(true_rookie_high_risk)
-        assert score >= 60, f"True rookie should have high risk, got {score}"
-
-    def test_fallback_to_projections_with_penalty(self, player_rookie):
+    @pytest.mark.parametrize("fixture_name,low,high", [
+        ("proven_veteran_low_risk", None, 10),         # 2500+ career PA
+        ("established_player_medium_risk", 10, 30),    # 650 career PA
+        ("limited_experience_player", 30, 60),         # 300 career PA
+        ("true_rookie_high_risk", 60, None),           # 50 career PA
+    ])
+    def test_experience_risk_bounds(self, engine, request, fixture_name, low, high):
+        """Experience risk should fall as career plate appearances grow."""
+        score = engine._calculate_experience_risk(request.getfixturevalue(fixture_name))
+        if low is not None:
+            assert score >= low, f"{fixture_name} should have risk >= {low}, got {score}"
+        if high is not None:
+            assert score <= high, f"{fixture_name} should have risk <= {high}, got {score}"
+
+    def test_fallback_to_projections_with_penalty(self, engine, player_rookie):
         """Player without career stats should use projections with penalty."""
-        engine = RecommendationEngine()
         # player_rookie has no career_pa set but has projections
         score = engine._calculate_experience_risk(player_rookie)
         # Should have added +20 penalty for using projections
@@ -500,81 +440,42 @@ class TestExperienceRiskWithCareerStats:
 class TestRankVarianceWithAbsoluteStdDev:
     """Tests for the improved rank variance using absolute std_dev."""
 
-    def test_elite_player_reduced_penalty(self, elite_low_variance):
-        """Elite player (top 25) should get 0.7x multiplier on variance."""
-        engine = RecommendationEngine()
-        score = engine._calculate_rank_variance(elite_low_variance)
-        # Rankings: 4, 5, 6 - std_dev ~1
-        # Base: 1 * 4 = 4, with 0.7x = 2.8
-        assert score < 10, f"Elite player with low variance should be very low, got {score}"
-
-    def test_late_round_increased_penalty(self, late_round_high_variance):
-        """Late round player (100+) should get 1.1x multiplier."""
-        engine = RecommendationEngine()
-        score = engine._calculate_rank_variance(late_round_high_variance)
-        # Rankings: 100, 130, 160 - high std_dev
-        assert score > 50, f"Late round high variance should be elevated, got {score}"
-
-    def test_high_stddev_capped_at_100(self, mock_player_factory):
-        """Even extreme variance should cap at 100."""
-        from tests.conftest import MockPlayerRanking
+    @pytest.mark.parametrize("ranks,expected", [
+        ([4, 5, 6], 1 * 4 * 0.7),              # elite tier: std_dev 1, 0.7x
+        ([40, 50, 60], 10 * 4),                # mid tier: std_dev 10, no adjustment
+        ([30, 50], 200 ** 0.5 * 4),            # mid tier, two sources
+        ([100, 110, 120], 10 * 4 * 1.1),       # late round: 1.1x
+        ([100, 130, 160], 100),                # late round, capped
+        ([10, 90], 100),                       # extreme spread, capped
+    ])
+    def test_stddev_score(self, engine, mock_player_factory, ranks, expected):
+        """Score is std_dev * 4 with the tier multiplier, capped at 100."""
         player = mock_player_factory(
-            name="Extreme Variance",
-            consensus_rank=50,
-            rankings=[
-                MockPlayerRanking(overall_rank=10, adp=20.0),
-                MockPlayerRanking(overall_rank=90, adp=100.0),
-            ],
-        )
-        engine = RecommendationEngine()
-        score = engine._calculate_rank_variance(player)
-        assert score <= 100, f"Variance score should cap at 100, got {score}"
-
-    def test_stddev_times_four_baseline(self, mock_player_factory):
-        """Std dev of 10 should give approximately 40 base score."""
-        from tests.conftest import MockPlayerRanking
-        # Create rankings with std_dev of exactly 10
-        # Rankings: 40, 50, 60 has std_dev of 10
-        player = mock_player_factory(
-            name="Medium Variance",
-            consensus_rank=50,
-            rankings=[
-                MockPlayerRanking(overall_rank=40, adp=45.0),
-                MockPlayerRanking(overall_rank=50, adp=50.0),
-                MockPlayerRanking(overall_rank=60, adp=55.0),
-            ],
+            rankings=[MockPlayerRanking(overall_rank=rank) for rank in ranks],
         )
-        engine = RecommendationEngine()
-        score = engine._calculate_rank_variance(player)
-        # std_dev ~10, * 4 = 40, multiplier 1.0 (mid-tier)
-        assert 35 <= score <= 45, f"Std dev of 10 should give ~40, got {score}"
+        assert engine._calculate_rank_variance(player) == pytest.approx(expected)
 
 
 class TestRiskCaching:
     """Tests for the TTL cache in RecommendationEngine."""
 
-    def test_cache_returns_same_result(self, player_with_consistent_rankings):
+    def test_cache_returns_same_result(self, engine, player_with_consistent_rankings):
         """Same player should return cached result."""
-        engine = RecommendationEngine()
         first_result = engine.calculate_risk_score(player_with_consistent_rankings)
         second_result = engine.calculate_risk_score(player_with_consistent_rankings)
         assert first_result.score == second_result.score
         assert first_result.classification == second_result.classification
 
-    def test_cache_can_be_bypassed(self, player_with_consistent_rankings):
+    def test_cache_can_be_bypassed(
+        self, engine, player_with_consistent_rankings, uncached_consistent_score
+    ):
         """use_cache=False should bypass cache."""
-        engine = RecommendationEngine()
-        first_result = engine.calculate_risk_score(player_with_consistent_rankings, use_cache=True)
-        # Bypass cache - should still calculate correctly
-        second_result = engine.calculate_risk_score(player_with_consistent_rankings, use_cache=False)
+        cached = engine.calculate_risk_score(player_with_consistent_rankings, use_cache=True)
         # Results should match (no data changed)
-        assert first_result.score == second_result.score
+        assert cached.score == uncached_consistent_score
 
-    def test_cache_invalidation_on_attribute_change(self, mock_player_factory):
+    def test_cache_invalidation_on_attribute_change(self, fresh_engine, mock_player_factory):
         """Cache should miss when player attributes change."""
-        from tests.conftest import MockPlayerRanking, MockPlayerProjection
-        engine = RecommendationEngine()
-
         player = mock_player_factory(
             name="Changing Player",
             age=27,
@@ -583,43 +484,40 @@ class TestRiskCaching:
             projections=[MockPlayerProjection(pa=550)],
         )
 
-        first_result = engine.calculate_risk_score(player)
+        first_result = fresh_engine.calculate_risk_score(player)
 
         # Change age - should generate different cache key
         player.age = 35
-        second_result = engine.calculate_risk_score(player)
+        second_result = fresh_engine.calculate_risk_score(player)
 
         # Results should be different because age changed
         assert first_result.score != second_result.score
 
-    def test_cleanup_expired_removes_reverse_index_entries(self, player_with_consistent_rankings):
+    def test_cleanup_expired_removes_reverse_index_entries(self, fresh_engine, player_with_consistent_rankings):
         """Expired entries should be removed from both cache maps."""
-        engine = RecommendationEngine()
-        engine.calculate_risk_score(player_with_consistent_rankings)
-        assert engine._risk_cache._player_keys  # populated
+        fresh_engine.calculate_risk_score(player_with_consistent_rankings)
+        assert fresh_engine._risk_cache._player_keys  # populated
 
         # Force immediate expiration and cleanup
-        engine._risk_cache._ttl = 0
-        removed = engine._risk_cache.cleanup_expired()
+        fresh_engine._risk_cache._ttl = 0
+        removed = fresh_engine._risk_cache.cleanup_expired()
 
         assert removed >= 1
-        assert engine._risk_cache._cache == {}
-        assert engine._risk_cache._player_keys == {}
+        assert fresh_engine._risk_cache._cache == {}
+        assert fresh_engine._risk_cache._player_keys == {}
 
 
 class TestIntegratedRiskScore:
     """Integration tests for overall risk scoring with new algorithms."""
 
-    def test_young_proven_hitter_is_safe(self, young_hitter_at_peak):
+    def test_young_proven_hitter_is_safe(self, engine, young_hitter_at_peak):
         """27-year-old hitter at peak with good track record should be safe."""
-        engine = RecommendationEngine()
         assessment = engine.calculate_risk_score(young_hitter_at_peak)
         assert assessment.classification == "safe", \
             f"Peak age proven hitter should be safe, got {assessment.classification}"
 
-    def test_aging_injury_prone_is_risky(self, mock_player_factory):
+    def test_aging_injury_prone_is_risky(self, engine, mock_player_factory):
         """Older injured player should be risky."""
-        from tests.conftest import MockPlayerRanking, MockPlayerProjection, MockPlayerNews
         player = mock_player_factory(
             name="Old Injured",
             age=35,
@@ -636,14 +534,12 @@ class TestIntegratedRiskScore:
                 MockPlayerNews(is_injury_related=True, headline="Shoulder soreness"),
             ],
         )
-        engine = RecommendationEngine()
         assessment = engine.calculate_risk_score(player)
         assert assessment.classification in ["moderate", "risky"], \
             f"Injured aging pitcher should be risky, got {assessment.classification}"
 
-    def test_rookie_high_variance_is_risky(self, true_rookie_high_risk):
+    def test_rookie_high_variance_is_risky(self, engine, true_rookie_high_risk):
         """Rookie with high variance rankings should be risky or moderate."""
-        engine = RecommendationEngine()
         assessment = engine.calculate_risk_score(true_rookie_high_risk)
         # Rookie has both experience risk AND ranking variance
         assert assessment.classification in ["moderate", "risky"], \
@@ -656,15 +552,13 @@ class TestIntegratedRiskScore:
 class TestRosterComposition:
     """Tests for get_roster_composition method."""
 
-    def test_empty_roster_returns_empty(self):
+    def test_empty_roster_returns_empty(self, engine):
         """Empty roster should return empty composition."""
-        engine = RecommendationEngine()
         composition = engine.get_roster_composition([])
         assert composition == {}
 
-    def test_counts_positions_correctly(self, mock_player_factory):
+    def test_counts_positions_correctly(self, engine, mock_player_factory):
         """Should count players by primary position."""
-        engine = RecommendationEngine()
         players = [
             mock_player_factory(name="C1", primary_position="C"),
             mock_player_factory(name="SS1", primary_position="SS"),
@@ -676,9 +570,8 @@ class TestRosterComposition:
         composition = engine.get_roster_composition(players)
         assert composition == {"C": 1, "SS": 2, "OF": 3}
 
-    def test_util_for_missing_position(self, mock_player_factory):
+    def test_util_for_missing_position(self, engine, mock_player_factory):
         """Players without primary_position should be counted as UTIL."""
-        engine = RecommendationEngine()
         player = mock_player_factory(name="No Position")
         player.primary_position = None
         composition = engine.get_roster_composition([player])
@@ -688,54 +581,24 @@ class TestRosterComposition:
 class TestPositionNeedScore:
     """Tests for calculate_position_need_score method."""
 
-    def test_empty_slot_max_need(self):
-        """Empty slot should return 100 (maximum need)."""
-        engine = RecommendationEngine()
-        roster_slots = {"C": 1, "SS": 1, "OF": 3}
-        roster_composition = {}  # No players drafted
-        score = engine.calculate_position_need_score("C", roster_composition, roster_slots)
-        assert score == 100
-
-    def test_filled_slot_zero_need(self):
-        """Filled slot should return 0 (no need)."""
-        engine = RecommendationEngine()
-        roster_slots = {"C": 1, "SS": 1}
-        roster_composition = {"C": 1}  # C slot filled
-        score = engine.calculate_position_need_score("C", roster_composition, roster_slots)
-        assert score == 0
-
-    def test_partial_fill_proportional_need(self):
-        """Partially filled should return proportional need."""
-        engine = RecommendationEngine()
-        roster_slots = {"OF": 3}
-        roster_composition = {"OF": 1}  # 1 of 3 OF filled
-        score = engine.calculate_position_need_score("OF", roster_composition, roster_slots)
-        # 2 of 3 unfilled = 66.67%
-        assert abs(score - 66.67) < 1
-
-    def test_overfilled_returns_zero(self):
-        """More players than slots should return 0."""
-        engine = RecommendationEngine()
-        roster_slots = {"C": 1}
-        roster_composition = {"C": 2}  # More than needed
-        score = engine.calculate_position_need_score("C", roster_composition, roster_slots)
-        assert score == 0
-
-    def test_unknown_position_defaults_to_one_slot(self):
-        """Unknown position should default to 1 slot requirement."""
-        engine = RecommendationEngine()
-        roster_slots = {"C": 1}  # DH not in slots
-        roster_composition = {}
-        score = engine.calculate_position_need_score("DH", roster_composition, roster_slots)
-        assert score == 100  # 1 slot needed, 0 filled
+    @pytest.mark.parametrize("position,composition,slots,expected", [
+        ("C", {}, {"C": 1, "SS": 1, "OF": 3}, 100),     # empty slot: maximum need
+        ("C", {"C": 1}, {"C": 1, "SS": 1}, 0),          # filled slot: no need
+        ("OF", {"OF": 1}, {"OF": 3}, 200 / 3),          # 2 of 3 unfilled
+        ("C", {"C": 2}, {"C": 1}, 0),                   # overfilled
+        ("DH", {}, {"C": 1}, 100),                      # unknown position defaults to 1 slot
+    ])
+    def test_need_score(self, engine, position, composition, slots, expected):
+        """Need is the unfilled share of the position's slots, 0-100."""
+        score = engine.calculate_position_need_score(position, composition, slots)
+        assert score == pytest.approx(expected, abs=0.01)
 
 
 class TestPositionScarcity:
     """Tests for calculate_position_scarcity method."""
 
-    def test_base_scarcity_applied(self, mock_player_factory):
+    def test_base_scarcity_applied(self, engine, mock_player_factory):
         """Base scarcity multipliers from config should be applied."""
-        engine = RecommendationEngine()
         # Create players for different positions
         catcher = mock_player_factory(name="C1", primary_position="C")
         first_base = mock_player_factory(name="1B1", primary_position="1B")
@@ -746,9 +609,8 @@ class TestPositionScarcity:
 
         assert c_scarcity > fb_scarcity, "C should be more scarce than 1B"
 
-    def test_scarcity_increases_with_fewer_available(self, mock_player_factory):
+    def test_scarcity_increases_with_fewer_available(self, engine, mock_player_factory):
         """Scarcity should increase when fewer players available."""
-        engine = RecommendationEngine()
         # Create many catchers
         many_catchers = [mock_player_factory(name=f"C{i}", primary_position="C") for i in range(15)]
         # Create few catchers
@@ -759,9 +621,8 @@ class TestPositionScarcity:
 
         assert scarcity_few > scarcity_many, "Fewer catchers should mean higher scarcity"
 
-    def test_unknown_position_default_scarcity(self, mock_player_factory):
+    def test_unknown_position_default_scarcity(self, engine, mock_player_factory):
         """Unknown position should default to 1.0 base scarcity."""
-        engine = RecommendationEngine()
         player = mock_player_factory(name="DH1", primary_position="DH")
         scarcity = engine.calculate_position_scarcity("DH", [player], 0, 12)
         # Should be around 1.0 base with some dynamic adjustment
@@ -771,239 +632,104 @@ class TestPositionScarcity:
 class TestRecommendedPicksWithPositionAwareness:
     """Tests for get_recommended_picks with position scarcity and need."""
 
-    def test_position_need_boosts_recommendation(self, mock_player_factory):
-        """Players at needed positions should rank higher."""
-        from tests.conftest import MockPlayerRanking, MockPlayerProjection
-
-        engine = RecommendationEngine()
-
-        # Create two similarly ranked players
-        catcher = mock_player_factory(
-            name="Good Catcher",
-            primary_position="C",
-            consensus_rank=30,
-            rankings=[MockPlayerRanking(overall_rank=30, adp=30.0)],
-            projections=[MockPlayerProjection(pa=400, hr=15)],
-        )
-        first_base = mock_player_factory(
-            name="Good 1B",
-            primary_position="1B",
-            consensus_rank=28,  # Slightly better rank
-            rankings=[MockPlayerRanking(overall_rank=28, adp=28.0)],
-            projections=[MockPlayerProjection(pa=550, hr=25)],
-        )
-
-        # User already has 1B but needs C
-        my_team = [mock_player_factory(name="My 1B", primary_position="1B")]
-
-        recommendations = engine.get_recommended_picks(
-            players=[catcher, first_base],
-            my_team_players=my_team,
-            total_picks_made=10,
-            num_teams=12,
-            limit=2,
-        )
-
-        # Catcher should be recommended higher due to roster need
-        assert recommendations[0].player.name == "Good Catcher", \
-            "Catcher should be recommended first due to position need"
-
-    def test_scarcity_affects_recommendations(self, mock_player_factory):
-        """Scarce positions should be weighted higher early in draft."""
-        from tests.conftest import MockPlayerRanking, MockPlayerProjection
-
-        engine = RecommendationEngine()
-
-        # Create SS and 1B with same rank
-        shortstop = mock_player_factory(
-            name="Elite SS",
-            primary_position="SS",
-            consensus_rank=20,
-            rankings=[MockPlayerRanking(overall_rank=20, adp=20.0)],
-            projections=[MockPlayerProjection(pa=600, hr=20, sb=15)],
-        )
-        first_base = mock_player_factory(
-            name="Elite 1B",
-            primary_position="1B",
-            consensus_rank=20,
-            rankings=[MockPlayerRanking(overall_rank=20, adp=20.0)],
-            projections=[MockPlayerProjection(pa=600, hr=35)],
-        )
+    @pytest.mark.parametrize("candidates,my_team,total_picks_made,expected_first", [
+        # User already has 1B but needs C; the catcher outranks a slightly better 1B
+        (
+            [
+                dict(name="Good Catcher", primary_position="C", consensus_rank=30,
+                     overall_rank=30, projection=dict(pa=400, hr=15)),
+                dict(name="Good 1B", primary_position="1B", consensus_rank=28,
+                     overall_rank=28, projection=dict(pa=550, hr=25)),
+            ],
+            [dict(name="My 1B", primary_position="1B")],
+            10,
+            "Good Catcher",
+        ),
+        # No roster yet: SS (1.20 scarcity) outranks an equally ranked 1B (0.90)
+        (
+            [
+                dict(name="Elite SS", primary_position="SS", consensus_rank=20,
+                     overall_rank=20, projection=dict(pa=600, hr=20, sb=15)),
+                dict(name="Elite 1B", primary_position="1B", consensus_rank=20,
+                     overall_rank=20, projection=dict(pa=600, hr=35)),
+            ],
+            [],
+            0,
+            "Elite SS",
+        ),
+    ], ids=["position_need", "scarcity"])
+    def test_boosts_recommendation(
+        self, engine, mock_player_factory, candidates, my_team, total_picks_made, expected_first
+    ):
+        """Position need and scarcity should lift a player above a similar one."""
+        players = [_ranked_player(mock_player_factory, **kwargs) for kwargs in candidates]
 
-        # No roster yet - should favor scarce position
         recommendations = engine.get_recommended_picks(
-            players=[shortstop, first_base],
-            my_team_players=[],
-            total_picks_made=0,
+            players=players,
+            my_team_players=[mock_player_factory(**kwargs) for kwargs in my_team],
+            total_picks_made=total_picks_made,
             num_teams=12,
             limit=2,
         )
 
-        # SS (1.20 scarcity) should rank higher than 1B (0.90 scarcity)
-        assert recommendations[0].player.name == "Elite SS", \
-            "SS should rank higher due to position scarcity"
-
-    def test_reasoning_includes_position_need(self, mock_player_factory):
-        """Reasoning should mention position need when applicable."""
-        from tests.conftest import MockPlayerRanking, MockPlayerProjection
-
-        engine = RecommendationEngine()
-
-        catcher = mock_player_factory(
-            name="Needed Catcher",
-            primary_position="C",
-            consensus_rank=50,
-            rankings=[MockPlayerRanking(overall_rank=50, adp=50.0)],
-            projections=[MockPlayerProjection(pa=400, hr=15)],
-        )
+        assert recommendations[0].player.name == expected_first
 
+    @pytest.mark.parametrize("candidate,total_picks_made,keywords", [
         # User has no catcher
+        (dict(name="Needed Catcher", primary_position="C", consensus_rank=50,
+              overall_rank=50, projection=dict(pa=400, hr=15)), 0, ("C", "roster")),
+        # One catcher available mid-draft vs ~15 expected: scarcity multiplier >= 1.25
+        (dict(name="Scarce Catcher", primary_position="C", consensus_rank=40,
+              overall_rank=40, projection=dict(pa=400, hr=15)), 60, ("Scarce", "limited")),
+    ], ids=["position_need", "scarcity"])
+    def test_reasoning_mentions(
+        self, engine, mock_player_factory, candidate, total_picks_made, keywords
+    ):
+        """Reasoning should mention position need or scarcity when they apply."""
         recommendations = engine.get_recommended_picks(
-            players=[catcher],
-            my_team_players=[],
-            total_picks_made=0,
-            num_teams=12,
-            limit=1,
-        )
-
-        # Should mention roster need in reasoning
-        reasoning_text = " ".join(recommendations[0].reasoning)
-        assert "C" in reasoning_text or "roster" in reasoning_text.lower(), \
-            f"Reasoning should mention position need: {reasoning_text}"
-
-    def test_reasoning_includes_scarcity(self, mock_player_factory):
-        """Reasoning should mention scarcity for scarce positions."""
-        from tests.conftest import MockPlayerRanking, MockPlayerProjection
-
-        engine = RecommendationEngine()
-
-        # Create a catcher (high scarcity) with few catchers available
-        catcher = mock_player_factory(
-            name="Scarce Catcher",
-            primary_position="C",
-            consensus_rank=40,
-            rankings=[MockPlayerRanking(overall_rank=40, adp=40.0)],
-            projections=[MockPlayerProjection(pa=400, hr=15)],
-        )
-
-        # Very few catchers available (fewer than expected 15)
-        few_catchers = [catcher]
-
-        recommendations = engine.get_recommended_picks(
-            players=few_catchers,
+            players=[_ranked_player(mock_player_factory, **candidate)],
             my_team_players=[],
-            total_picks_made=60,  # Mid-draft
+            total_picks_made=total_picks_made,
             num_teams=12,
             limit=1,
         )
 
-        # Should mention scarcity in reasoning (scarcity multiplier >= 1.25)
         reasoning_text = " ".join(recommendations[0].reasoning)
-        # With only 1 catcher available vs expected 15, scarcity should be very high
-        assert "Scarce" in reasoning_text or "limited" in reasoning_text.lower(), \
-            f"Reasoning should mention scarcity: {reasoning_text}"
+        assert any(k in reasoning_text or k in reasoning_text.lower() for k in keywords), \
+            f"Reasoning should mention one of {keywords}: {reasoning_text}"
 
 
 class TestBreakoutDetection:
     """Tests for breakout candidate detection in _identify_upside."""
 
-    def test_young_player_big_rank_jump_is_breakout(self, mock_player_factory):
-        """Young player (25) with 80→40 rank jump should be breakout candidate."""
+    @pytest.mark.parametrize("age,consensus_rank,last_season_rank,ranks,expected_breakout", [
+        (25, 40, 80, [(35, 45.0), (45, 40.0)], True),     # young, 80→40 jump
+        (30, 40, 80, [(35, 45.0), (45, 40.0)], False),    # same jump at 30
+        (25, 45, 50, [(43, 47.0), (47, 45.0)], False),    # 50→45 is only 10%
+        (25, 40, None, [(38, 42.0)], False),              # no last-season rank
+        (None, 40, 80, [(38, 42.0)], False),              # no age
+        (25, 60, 30, [(55, 65.0), (65, 60.0)], False),    # rank worsened 30→60
+    ], ids=["breakout", "too_old", "small_jump", "no_history", "no_age", "declining"])
+    def test_breakout_detection(
+        self, engine, mock_player_factory,
+        age, consensus_rank, last_season_rank, ranks, expected_breakout,
+    ):
+        """Only young players with a big rank jump are flagged as breakout candidates."""
         player = mock_player_factory(
-            name="Breakout Star",
-            age=25,
-            consensus_rank=40,
-            last_season_rank=80,
-            rankings=[
-                MockPlayerRanking(overall_rank=35, adp=45.0),
-                MockPlayerRanking(overall_rank=45, adp=40.0),
-            ],
+            age=age,
+            consensus_rank=consensus_rank,
+            last_season_rank=last_season_rank,
+            rankings=[MockPlayerRanking(overall_rank=rank, adp=adp) for rank, adp in ranks],
         )
-        engine = RecommendationEngine()
-        upside = engine._identify_upside(player, {"rank_variance": 20})
-        assert "Breakout candidate" in upside
-        assert "#40" in upside
-        assert "#80" in upside
-
-    def test_old_player_no_breakout(self, mock_player_factory):
-        """Player aged 30 with same rank jump should NOT be breakout candidate."""
-        player = mock_player_factory(
-            name="Veteran Jump",
-            age=30,
-            consensus_rank=40,
-            last_season_rank=80,
-            rankings=[
-                MockPlayerRanking(overall_rank=35, adp=45.0),
-                MockPlayerRanking(overall_rank=45, adp=40.0),
-            ],
-        )
-        engine = RecommendationEngine()
-        upside = engine._identify_upside(player, {"rank_variance": 20})
-        assert "Breakout candidate" not in upside
-
-    def test_small_improvement_no_breakout(self, mock_player_factory):
-        """Small rank improvement (50→45, 10%) should NOT trigger breakout."""
-        player = mock_player_factory(
-            name="Marginal Improver",
-            age=25,
-            consensus_rank=45,
-            last_season_rank=50,
-            rankings=[
-                MockPlayerRanking(overall_rank=43, adp=47.0),
-                MockPlayerRanking(overall_rank=47, adp=45.0),
-            ],
-        )
-        engine = RecommendationEngine()
-        upside = engine._identify_upside(player, {"rank_variance": 20})
-        assert "Breakout candidate" not in upside
+        scores = {"rank_variance": 20} if len(ranks) > 1 else {}
+        upside = engine._identify_upside(player, scores)
 
-    def test_no_last_season_rank_no_crash(self, mock_player_factory):
-        """Player with last_season_rank=None should not crash or show breakout."""
-        player = mock_player_factory(
-            name="No History",
-            age=25,
-            consensus_rank=40,
-            last_season_rank=None,
-            rankings=[
-                MockPlayerRanking(overall_rank=38, adp=42.0),
-            ],
-        )
-        engine = RecommendationEngine()
-        upside = engine._identify_upside(player, {})
-        assert "Breakout candidate" not in upside
-
-    def test_no_age_no_crash(self, mock_player_factory):
-        """Player with age=None should not crash or show breakout."""
-        player = mock_player_factory(
-            name="Ageless Wonder",
-            age=None,
-            consensus_rank=40,
-            last_season_rank=80,
-            rankings=[
-                MockPlayerRanking(overall_rank=38, adp=42.0),
-            ],
-        )
-        engine = RecommendationEngine()
-        upside = engine._identify_upside(player, {})
-        assert "Breakout candidate" not in upside
-
-    def test_declining_player_no_breakout(self, mock_player_factory):
-        """Player whose rank worsened (30→60) should NOT be breakout candidate."""
-        player = mock_player_factory(
-            name="Declining Player",
-            age=25,
-            consensus_rank=60,
-            last_season_rank=30,
-            rankings=[
-                MockPlayerRanking(overall_rank=55, adp=65.0),
-                MockPlayerRanking(overall_rank=65, adp=60.0),
-            ],
-        )
-        engine = RecommendationEngine()
-        upside = engine._identify_upside(player, {"rank_variance": 20})
-        assert "Breakout candidate" not in upside
+        assert ("Breakout candidate" in upside) == expected_breakout
+        if expected_breakout:
+            assert f"#{consensus_rank}" in upside
+            assert f"#{last_season_rank}" in upside
 
-    def test_moderate_player_gets_upside_computed(self, mock_player_factory):
+    def test_moderate_player_gets_upside_computed(self, engine, mock_player_factory):
         """Moderate-risk player should now have upside computed (not None)."""
         # Create a player that lands in "moderate" classification
         # Moderate needs score >= safe_threshold but < risky_threshold
@@ -1019,13 +745,12 @@ class TestBreakoutDetection:
                 MockPlayerProjection(pa=500, hr=20, sb=10, avg=0.260),
             ],
         )
-        engine = RecommendationEngine()
         assessment = engine.calculate_risk_score(player)
         if assessment.classification == "moderate":
             assert assessment.upside is not None, \
                 "Moderate-risk player should have upside computed"
 
-    def test_generic_fallback_shows_high_upside(self, mock_player_factory):
+    def test_generic_fallback_shows_high_upside(self, engine, mock_player_factory):
         """Generic fallback should show 'High upside' not 'Breakout potential'."""
         # Create a risky player with no special upside factors
         player = mock_player_factory(
@@ -1039,7 +764,6 @@ class TestBreakoutDetection:
             ],
             projections=[],
         )
-        engine = RecommendationEngine()
         risky_picks = engine.get_risky_picks([player])
         if risky_picks:
             assert "Breakout potential" not in risky_picks[0].upside, \
@@ -1,28 +1,26 @@
 """
 API integration tests for recommendations endpoints.
 
-Uses a fresh temp-file SQLite DB per test (function scope) with seeded League,
-Teams, and Players.  RecommendationEngine and CategoryCalculator FastAPI
-dependencies are overridden with lightweight mocks so no real projection/
-rankings data is needed.
+Uses one shared-cache in-memory SQLite DB per module, seeded once with
+Leagues, Teams and Players; each test's writes are rolled back.
+RecommendationEngine and CategoryCalculator FastAPI dependencies are
+overridden with lightweight mocks so no real projection/rankings data is
+needed.
 """
 
-import os
-import tempfile
-from contextlib import asynccontextmanager
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
 
 import app.models  # noqa: F401
-from app.database import Base, get_db
+from app.database import get_db
 from app.dependencies import get_category_calculator, get_recommendation_engine
 from app.main import app
 from app.models import League, Player, Team
+from conftest import FakeSessionCtx, RollbackConnection, build_memory_db, noop_init_db
 
 
 # ---------------------------------------------------------------------------
@@ -126,117 +124,123 @@ class _MockCatCalc:
 
 
 # ---------------------------------------------------------------------------
-# Per-test client fixture (function scope → fresh DB each test)
+# Fixtures (module-scoped DB, per-test rollback)
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def seeded_client():
+def _seed(conn):
     """
-    Function-scoped TestClient backed by a fresh temp-file SQLite DB.
-
-    Seeds two leagues:
+    Seed two leagues:
       - league_id         : has one user team (is_user_team=True, draft_position=1)
       - league_no_user_id : has one non-user team
 
     Also seeds 3 undrafted Players (no projections needed — service is mocked).
+    Core bulk inserts on the sync side of an async connection via ``run_sync``.
 
-    Yields: (client, {league_id, league_no_user_id, player_ids})
+    Returns: (league_id, league_no_user_id, player_ids)
     """
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
-
-    # ── 1: sync setup ──────────────────────────────────────────────────────
-    sync_engine = create_engine(f"sqlite:///{db_path}")
-    Base.metadata.create_all(sync_engine)
-
-    with Session(sync_engine) as sess:
-        # League 1 — has a user team
-        league = League(espn_league_id=99, name="Test League", year=2026, num_teams=12)
-        sess.add(league)
-        sess.flush()
-        league_id = league.id
-
-        user_team = Team(
-            league_id=league_id,
-            espn_team_id=1,
-            name="My Team",
-            draft_position=1,
-            is_user_team=True,
-        )
-        sess.add(user_team)
-
-        # League 2 — no user team
-        league2 = League(espn_league_id=100, name="No User League", year=2026, num_teams=12)
-        sess.add(league2)
-        sess.flush()
-        league_no_user_id = league2.id
-
-        other_team = Team(
-            league_id=league_no_user_id,
-            espn_team_id=2,
-            name="Other Team",
-            draft_position=1,
-            is_user_team=False,
-        )
-        sess.add(other_team)
-
-        # 3 undrafted players (no projections — service is mocked)
-        players = [
-            Player(name="Player A", positions="OF", primary_position="OF",
-                   consensus_rank=1, is_drafted=False),
-            Player(name="Player B", positions="SP", primary_position="SP",
-                   consensus_rank=2, is_drafted=False),
-            Player(name="Player C", positions="1B", primary_position="1B",
-                   consensus_rank=3, is_drafted=False),
-        ]
-        for p in players:
-            sess.add(p)
-        sess.flush()
-        player_ids = [p.id for p in players]
-
-        sess.commit()
-
-    sync_engine.dispose()
-
-    # ── 2: async engine for TestClient ────────────────────────────────────
-    client_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
-    ClientSession = async_sessionmaker(
-        client_engine, expire_on_commit=False, class_=AsyncSession
+    league_id, league_no_user_id = conn.scalars(
+        insert(League).returning(League.id, sort_by_parameter_order=True),
+        [
+            dict(espn_league_id=99, name="Test League", year=2026, num_teams=12),
+            dict(espn_league_id=100, name="No User League", year=2026, num_teams=12),
+        ],
+    ).all()
+
+    conn.execute(
+        insert(Team),
+        [
+            dict(league_id=league_id, espn_team_id=1, name="My Team",
+                 draft_position=1, is_user_team=True),
+            dict(league_id=league_no_user_id, espn_team_id=2, name="Other Team",
+                 draft_position=1, is_user_team=False),
+        ],
     )
 
-    async def override_get_db():
-        async with ClientSession() as session:
-            yield session
+    player_ids = conn.scalars(
+        insert(Player).returning(Player.id, sort_by_parameter_order=True),
+        [
+            dict(name="Player A", positions="OF", primary_position="OF",
+                 consensus_rank=1, is_drafted=False),
+            dict(name="Player B", positions="SP", primary_position="SP",
+                 consensus_rank=2, is_drafted=False),
+            dict(name="Player C", positions="1B", primary_position="1B",
+                 consensus_rank=3, is_drafted=False),
+        ],
+    ).all()
+
+    return league_id, league_no_user_id, player_ids
+
+
+@pytest.fixture(scope="module")
+def seeded_db():
+    """
+    Module-scoped shared-cache in-memory DB; schema and seed (see ``_seed``) run once.
+
+    Yields: (engine, {league_id, league_no_user_id, player_ids})
+    """
+    engine, (league_id, league_no_user_id, player_ids) = asyncio.run(build_memory_db(_seed))
+
+    yield engine, {
+        "league_id": league_id,
+        "league_no_user_id": league_no_user_id,
+        "player_ids": player_ids,
+    }
+
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _lifespan_stubs(request):
+    """Stub app.main's ``init_db`` and ``async_session`` once for the module."""
+    for patcher in (
+        patch("app.main.init_db", new=noop_init_db),
+        patch("app.main.async_session", return_value=FakeSessionCtx()),
+    ):
+        patcher.start()
+        request.addfinalizer(patcher.stop)
 
-    @asynccontextmanager
-    async def _fake_session_ctx():
-        mock_db = AsyncMock()
-        mock_db.scalar.return_value = 1
-        yield mock_db
 
+@pytest.fixture(scope="module")
+def test_client():
+    """
+    One TestClient for the module, with the service mocks installed.
+
+    Its lifespan runs once, against the stubs from ``_lifespan_stubs``;
+    tests only swap the ``get_db`` override.
+    """
     _mock_engine = _MockRecEngine()
     _mock_calc = _MockCatCalc()
 
-    app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[get_recommendation_engine] = lambda: _mock_engine
     app.dependency_overrides[get_category_calculator] = lambda: _mock_calc
 
-    with (
-        patch("app.main.init_db", new=AsyncMock()),
-        patch("app.main.async_session", return_value=_fake_session_ctx()),
-    ):
-        with TestClient(app) as c:
-            yield c, {
-                "league_id": league_id,
-                "league_no_user_id": league_no_user_id,
-                "player_ids": player_ids,
-            }
+    with TestClient(app) as c:
+        yield c
 
     app.dependency_overrides.clear()
-    try:
-        os.unlink(db_path)
-    except OSError:
-        pass
+
+
+@pytest.fixture
+def seeded_client(seeded_db, test_client):
+    """
+    The module's TestClient on the module's DB; the test's writes are rolled back.
+
+    Yields: (client, {league_id, league_no_user_id, player_ids})
+    """
+    engine, ids = seeded_db
+    rollback_conn = RollbackConnection(engine)
+
+    async def override_get_db():
+        session = await rollback_conn.session()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield test_client, ids
+    del app.dependency_overrides[get_db]
+    asyncio.run(rollback_conn.rollback())
 
 
 # ---------------------------------------------------------------------------
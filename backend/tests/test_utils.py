@@ -60,12 +60,23 @@ class TestNormalizeName:
     def test_removes_jr_suffix(self):
         assert normalize_name("Ronald Acuña Jr.") == "ronald acuna"
 
+    def test_accented_name_matches_ascii_spelling(self):
+        assert normalize_name("José Ramírez Jr.") == normalize_name("Jose Ramirez")
+
+    def test_removes_decomposed_accents(self):
+        # "n" + combining tilde, as some sources send it: already NFD, still accented
+        assert normalize_name("Ronald Acun\u0303a") == "ronald acuna"
+
     def test_removes_sr_suffix(self):
         assert normalize_name("Ken Griffey Sr.") == "ken griffey"
 
     def test_removes_roman_suffixes(self):
         assert normalize_name("Cal Ripken II") == "cal ripken"
 
+    def test_suffix_must_be_its_own_word(self):
+        assert normalize_name("Ken Griffey III") == "ken griffey"
+        assert normalize_name("Kalani Kaii") == "kalani kaii"
+
     def test_hyphen_becomes_space(self):
         assert normalize_name("Pete Crow-Armstrong") == "pete crow armstrong"
 
@@ -122,4 +133,10 @@ class TestGenerateFantasyProsUrl:
 
     def test_accented_name(self):
         url = generate_fantasypros_player_url("Ronald Acuña Jr.")
-        assert "ronald-acuna-jr" in url
\ No newline at end of file
+        assert "ronald-acuna-jr" in url
+
+    def test_repeat_name_is_cache_hit(self):
+        first = generate_fantasypros_player_url("Juan Soto")
+        hits = generate_fantasypros_player_url.cache_info().hits
+        assert generate_fantasypros_player_url("Juan Soto") is first
+        assert generate_fantasypros_player_url.cache_info().hits == hits + 1
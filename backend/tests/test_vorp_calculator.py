@@ -5,25 +5,28 @@ No DB or async I/O required — all tests use lightweight stub objects that
 match the attribute interface expected by the calculator.
 """
 
+import functools
+
+import pytest
+
 from app.services.vorp_calculator import VORPCalculator
+from conftest import ProjectionStub
 
 
 # ---------------------------------------------------------------------------
-# Minimal stubs (no DB models, no conftest dependency)
+# Minimal stubs (no DB models)
 # ---------------------------------------------------------------------------
 
-class _Proj:
-    """Minimal projection stub."""
+class _Player:
+    """Minimal player stub."""
 
-    def __init__(self, **kwargs):
-        defaults = dict(
-            pa=0.0, ip=0.0, hr=0.0, rbi=0.0, sb=0.0, avg=0.0,
-            runs=0.0, ops=0.0, strikeouts=0.0, era=0.0, whip=0.0,
-            wins=0.0, saves=0.0, quality_starts=0.0,
-        )
-        defaults.update(kwargs)
-        for k, v in defaults.items():
-            setattr(self, k, v)
+    __slots__ = ("id", "primary_position", "positions", "projections")
+
+    def __init__(self, id, primary_position, positions, projections):
+        self.id = id
+        self.primary_position = primary_position
+        self.positions = positions
+        self.projections = projections
 
 
 _player_counter = 0
@@ -32,20 +35,16 @@ _player_counter = 0
 def _batter(primary_position="OF", positions=None, **proj_kwargs):
     global _player_counter
     _player_counter += 1
+    return _Player(
+        id=_player_counter,
+        primary_position=primary_position,
+        positions=positions or primary_position,
+        projections=[ProjectionStub(**proj_kwargs)] if proj_kwargs else [],
+    )
 
-    class _P:
-        pass
-
-    p = _P()
-    p.id = _player_counter
-    p.primary_position = primary_position
-    p.positions = positions or primary_position
-    p.projections = [_Proj(**proj_kwargs)] if proj_kwargs else []
-    return p
 
-
-def _pitcher(primary_position="SP", positions=None, **proj_kwargs):
-    return _batter(primary_position=primary_position, positions=positions or primary_position, **proj_kwargs)
+# A pitcher is a batter stub that defaults to SP; pass RP as primary_position=
+_pitcher = functools.partial(_batter, primary_position="SP")
 
 
 # Standard batter stats for a useful projection
@@ -53,6 +52,49 @@ _BATTER_STATS = dict(pa=600, hr=25, rbi=80, sb=10, avg=0.270, runs=80, ops=0.820
 _PITCHER_STATS = dict(ip=180, strikeouts=200, era=3.50, whip=1.10, wins=12, saves=0, quality_starts=20)
 
 
+@pytest.fixture(scope="module")
+def calc():
+    """One VORPCalculator for the module; it keeps no state between calls."""
+    return VORPCalculator()
+
+
+@pytest.fixture(scope="module")
+def big_pool():
+    """25 C + 50 OF batters with graded stats; read-only, built once."""
+    players = []
+    # 25 catchers: HR 25 down to 1
+    for hr in range(25, 0, -1):
+        players.append(_batter("C", pa=500, hr=hr, rbi=hr * 3, sb=2,
+                               avg=0.240 + hr * 0.002, runs=hr * 3, ops=0.700 + hr * 0.008))
+    # 50 outfielders: HR 50 down to 1
+    for hr in range(50, 0, -1):
+        players.append(_batter("OF", pa=600, hr=hr, rbi=hr * 3, sb=hr // 5 + 1,
+                               avg=0.250 + hr * 0.001, runs=hr * 3, ops=0.720 + hr * 0.006))
+    return players
+
+
+@pytest.fixture(scope="module")
+def z_pool(calc):
+    """(batters, pitchers, results) for 5 HR-graded OF and 5 ERA-graded SP.
+
+    Batters and pitchers are z-scored in separate pools, so one
+    calculate_all_vorp call serves every z-score test that reads it.
+    RBI (batters) and strikeouts (pitchers) are constant across each pool.
+    """
+    batters = [
+        _batter("OF", hr=hr, pa=600, rbi=80, sb=5, avg=0.270, runs=75, ops=0.800)
+        for hr in [15, 25, 35, 45, 55]
+    ]
+    pitchers = [
+        _pitcher(ip=180, era=era, strikeouts=200, whip=1.10, wins=12,
+                 saves=0, quality_starts=20)
+        for era in [2.0, 3.0, 4.0, 5.0, 6.0]
+    ]
+    results = calc.calculate_all_vorp(batters + pitchers, num_teams=12)
+    assert len(results) == 10
+    return batters, pitchers, results
+
+
 # ===========================================================================
 # TestZScoreCalculation
 # ===========================================================================
@@ -60,58 +102,39 @@ _PITCHER_STATS = dict(ip=180, strikeouts=200, era=3.50, whip=1.10, wins=12, save
 class TestZScoreCalculation:
     """Tests for z-score normalisation logic."""
 
-    def test_basic_z_scores(self):
+    def test_basic_z_scores(self, z_pool):
         """Mean of z-scores across the pool is ~0 for any category."""
-        players = [
-            _batter("OF", hr=hr, pa=600, rbi=80, sb=5, avg=0.270, runs=75, ops=0.800)
-            for hr in [15, 25, 35, 45, 55]
-        ]
-        calc = VORPCalculator()
-        results = calc.calculate_all_vorp(players, num_teams=12)
+        batters, _, results = z_pool
 
-        assert len(results) == 5
         # Sum of HR z-scores for any centered distribution is ~0
-        hr_sum = sum(v.z_scores.get("hr", 0.0) for v in results.values())
+        hr_sum = sum(results[p.id].z_scores.get("hr", 0.0) for p in batters)
         assert abs(hr_sum) < 0.01
 
-    def test_pool_too_small(self):
+    def test_pool_too_small(self, calc):
         """With only 2 batters, z_scores is empty (pool < 3 threshold)."""
         players = [
             _batter("OF", pa=600, hr=20, rbi=70, sb=5, avg=0.260, runs=70, ops=0.780),
             _batter("OF", pa=600, hr=30, rbi=90, sb=8, avg=0.290, runs=90, ops=0.860),
         ]
-        calc = VORPCalculator()
         results = calc.calculate_all_vorp(players, num_teams=12)
 
         for vorp in results.values():
             assert vorp.z_scores == {}, f"Expected empty z_scores, got {vorp.z_scores}"
 
-    def test_all_same_value(self):
-        """When every player has the same HR, all HR z-scores are 0."""
-        players = [
-            _batter("OF", pa=600, hr=30, rbi=80, sb=5, avg=0.270, runs=80, ops=0.810)
-            for _ in range(5)
-        ]
-        calc = VORPCalculator()
-        results = calc.calculate_all_vorp(players, num_teams=12)
+    @pytest.mark.parametrize("group, stat", [(0, "rbi"), (1, "strikeouts")])
+    def test_all_same_value(self, z_pool, group, stat):
+        """When every player in a pool shares a stat value, its z-scores are all 0."""
+        players, results = z_pool[group], z_pool[2]
 
-        for vorp in results.values():
-            assert vorp.z_scores.get("hr", 0.0) == 0.0
+        for p in players:
+            assert results[p.id].z_scores.get(stat, 0.0) == 0.0
 
-    def test_inverted_era(self):
+    def test_inverted_era(self, z_pool):
         """Lower ERA is better — its z-score is negated so best pitcher scores highest."""
-        eras = [2.0, 3.0, 4.0, 5.0, 6.0]
-        pitchers = [
-            _pitcher("SP", ip=180, era=era, strikeouts=200, whip=1.10, wins=12,
-                     saves=0, quality_starts=20)
-            for era in eras
-        ]
+        _, pitchers, results = z_pool
         best_pitcher = pitchers[0]   # ERA 2.0 (best)
         worst_pitcher = pitchers[-1]  # ERA 6.0 (worst)
 
-        calc = VORPCalculator()
-        results = calc.calculate_all_vorp(pitchers, num_teams=12)
-
         assert best_pitcher.id in results
         assert worst_pitcher.id in results
         best_era_z = results[best_pitcher.id].z_scores.get("era", 0.0)
@@ -121,7 +144,7 @@ class TestZScoreCalculation:
         )
         assert best_era_z > 0, "Best ERA pitcher should have positive era z-score"
 
-    def test_rate_stat_weighted_by_pa(self):
+    def test_rate_stat_weighted_by_pa(self, calc):
         """AVG contribution is (AVG × PA); high PA beats high rate in thin volume."""
         # Player A: very high AVG, low PA → contribution = 0.350 × 200 = 70
         # Player B: moderate AVG, high PA → contribution = 0.290 × 600 = 174
@@ -135,7 +158,6 @@ class TestZScoreCalculation:
         ]
         player_a, player_b = players[0], players[1]
 
-        calc = VORPCalculator()
         results = calc.calculate_all_vorp(players, num_teams=12)
 
         assert player_a.id in results
@@ -155,34 +177,14 @@ class TestZScoreCalculation:
 class TestReplacementLevels:
     """Tests for replacement-level computation per position."""
 
-    def _big_pool(self):
-        """Return a pool of 25 C + 50 OF batters with graded stats."""
-        players = []
-        # 25 catchers: HR 25 down to 1
-        for hr in range(25, 0, -1):
-            players.append(_batter("C", pa=500, hr=hr, rbi=hr * 3, sb=2,
-                                   avg=0.240 + hr * 0.002, runs=hr * 3, ops=0.700 + hr * 0.008))
-        # 50 outfielders: HR 50 down to 1
-        for hr in range(50, 0, -1):
-            players.append(_batter("OF", pa=600, hr=hr, rbi=hr * 3, sb=hr // 5 + 1,
-                                   avg=0.250 + hr * 0.001, runs=hr * 3, ops=0.720 + hr * 0.006))
-        return players
-
-    def test_catcher_scarcer_than_outfield(self):
+    def test_catcher_scarcer_than_outfield(self, calc, big_pool):
         """C replacement z is lower than OF replacement z (C is more scarce per team slot)."""
-        players = self._big_pool()
-        calc = VORPCalculator()
-        calc.calculate_all_vorp(players, num_teams=12)
+        results = calc.calculate_all_vorp(big_pool, num_teams=12)
 
-        # Recompute replacement levels internally to inspect
+        # Recompute replacement levels from the totals to inspect them
         # Use private helper directly (acceptable for unit testing the subsystem)
-        from app.services.vorp_calculator import VORPCalculator as _Calc
-        calc2 = _Calc()
-        results = calc2.calculate_all_vorp(players, num_teams=12)
-
-        # Gather total z per player
         total_z = {pid: vorp.total_z_score for pid, vorp in results.items()}
-        replacement_levels = calc2._calculate_replacement_levels(players, total_z, num_teams=12)
+        replacement_levels = calc._calculate_replacement_levels(big_pool, total_z, num_teams=12)
 
         assert "C" in replacement_levels
         assert "OF" in replacement_levels
@@ -190,7 +192,7 @@ class TestReplacementLevels:
             f"C repl={replacement_levels['C']:.2f} should be < OF repl={replacement_levels['OF']:.2f}"
         )
 
-    def test_replacement_index_formula(self):
+    def test_replacement_index_formula(self, calc):
         """repl_index = (12 * 1) + 2 = 14; the 14th catcher is the C replacement player."""
         # Create exactly 20 catchers with strictly decreasing HR values
         players = [
@@ -198,7 +200,6 @@ class TestReplacementLevels:
                     avg=0.240, runs=(21 - i) * 3, ops=0.700)
             for i in range(1, 21)
         ]
-        calc = VORPCalculator()
         results = calc.calculate_all_vorp(players, num_teams=12)
 
         total_z = {pid: vorp.total_z_score for pid, vorp in results.items()}
@@ -214,15 +215,14 @@ class TestReplacementLevels:
         expected_repl_z = sorted_catchers[14][1]
         assert abs(repl_levels["C"] - expected_repl_z) < 0.01
 
-    def test_position_with_no_eligible_players(self):
+    def test_position_with_no_eligible_players(self, calc):
         """A position with no eligible players returns 0.0 replacement level."""
         # Only SP pitchers; no 1B/2B/etc. field players
         players = [
-            _pitcher("SP", ip=180, era=3.0 + i * 0.3, strikeouts=200 - i * 10,
+            _pitcher(ip=180, era=3.0 + i * 0.3, strikeouts=200 - i * 10,
                      whip=1.10, wins=15 - i, saves=0, quality_starts=20 - i)
             for i in range(5)
         ]
-        calc = VORPCalculator()
         results = calc.calculate_all_vorp(players, num_teams=12)
 
         total_z = {pid: vorp.total_z_score for pid, vorp in results.items()}
@@ -231,10 +231,9 @@ class TestReplacementLevels:
         # "C" has no eligible pitchers → 0.0
         assert repl_levels.get("C", 0.0) == 0.0
 
-    def test_multi_team_scaling(self):
+    def test_multi_team_scaling(self, calc, big_pool):
         """More teams lowers the replacement level (deeper drafts consume more talent)."""
-        players = self._big_pool()
-        calc = VORPCalculator()
+        players = big_pool
 
         results_8 = calc.calculate_all_vorp(players, num_teams=8)
         results_14 = calc.calculate_all_vorp(players, num_teams=14)
@@ -268,14 +267,13 @@ class TestVORPSurplusValue:
             for i in range(n)
         ]
 
-    def test_top_player_positive_surplus(self):
+    def test_top_player_positive_surplus(self, calc):
         """Elite player (600 PA, 50 HR stats) has surplus_value > 0."""
         pool = self._make_standard_pool(20)
         # Add an elite player well above the pool
         elite = _batter("OF", pa=650, hr=55, rbi=130, sb=20, avg=0.310, runs=120, ops=0.980)
         pool.append(elite)
 
-        calc = VORPCalculator()
         results = calc.calculate_all_vorp(pool, num_teams=12)
 
         assert elite.id in results
@@ -283,7 +281,7 @@ class TestVORPSurplusValue:
             f"Elite player surplus should be > 0, got {results[elite.id].surplus_value}"
         )
 
-    def test_bench_player_negative_surplus(self):
+    def test_bench_player_negative_surplus(self, calc):
         """Player well below replacement level has surplus_value < 0.
 
         Use num_teams=4 so repl_index = 4*3+2 = 14, which is reachable with
@@ -295,7 +293,6 @@ class TestVORPSurplusValue:
         bench = _batter("OF", pa=300, hr=3, rbi=15, sb=1, avg=0.200, runs=15, ops=0.580)
         pool.append(bench)
 
-        calc = VORPCalculator()
         results = calc.calculate_all_vorp(pool, num_teams=4)  # repl_index=14 < 21
 
         assert bench.id in results
@@ -303,7 +300,7 @@ class TestVORPSurplusValue:
             f"Bench player surplus should be < 0, got {results[bench.id].surplus_value}"
         )
 
-    def test_multi_position_uses_best_slot(self):
+    def test_multi_position_uses_best_slot(self, calc):
         """A 1B/OF player's position_used yields the highest surplus among their positions."""
         # 8 strong 1B players (fewer starter slots → scarcer)
         pool_1b = [
@@ -322,7 +319,6 @@ class TestVORPSurplusValue:
                         pa=620, hr=40, rbi=110, sb=6, avg=0.295, runs=105, ops=0.920)
 
         pool = pool_1b + pool_of + [multi]
-        calc = VORPCalculator()
         results = calc.calculate_all_vorp(pool, num_teams=12)
 
         assert multi.id in results
@@ -333,20 +329,18 @@ class TestVORPSurplusValue:
         expected_surplus = round(vorp.total_z_score - vorp.replacement_z_score, 2)
         assert abs(vorp.surplus_value - expected_surplus) <= 0.01
 
-    def test_player_without_projections_excluded(self):
+    def test_player_without_projections_excluded(self, calc):
         """A player with no projections is not included in VORP results."""
         pool = self._make_standard_pool(5)
         no_proj = _batter("OF")  # no projections
         no_proj.projections = []
         pool.append(no_proj)
 
-        calc = VORPCalculator()
         results = calc.calculate_all_vorp(pool, num_teams=12)
 
         assert no_proj.id not in results, "Player without projections should be excluded"
 
-    def test_empty_player_list(self):
+    def test_empty_player_list(self, calc):
         """Empty player list returns empty dict."""
-        calc = VORPCalculator()
         results = calc.calculate_all_vorp([], num_teams=12)
         assert results == {}